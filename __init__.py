@@ -14,8 +14,10 @@ import bpy
 from pathlib import Path
 from .ui import ui_main
 from .properties import properties
+from .properties import review_properties
 from . import preferences
 from .utils.logging_config import setup_logging
+from .operators import operator_helpers
 
 logger = logging.getLogger(__name__)
 
@@ -51,10 +53,14 @@ def register():
     
     preferences.register()
     properties.register()
+    review_properties.register()
     ui_main.register()
+    operator_helpers.register_handlers()
 
 def unregister():
+    operator_helpers.unregister_handlers()
     ui_main.unregister()
+    review_properties.unregister()
     properties.unregister()
     preferences.unregister()
 
@@ -344,6 +344,12 @@ class ForesterDB:
             ON comments(created_at)
         """)
 
+        # Covers get_comments(include_resolved=False): filter and ORDER BY created_at
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_comments_asset_unresolved
+            ON comments(asset_hash, asset_type, resolved, created_at)
+        """)
+
         # Indexes for approvals
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_approvals_asset
@@ -355,6 +361,12 @@ class ForesterDB:
             ON approvals(status)
         """)
 
+        # Covers get_all_approvals: filter and ORDER BY created_at DESC
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_approvals_asset_created_at
+            ON approvals(asset_hash, asset_type, created_at)
+        """)
+
         self.conn.commit()
 
     # ========== Commits operations ==========
@@ -9,6 +9,34 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from .hashing import hash_to_path
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, the standard library parser is used without it
+    orjson = None
+
+
+def load_json_file(path: Path) -> Any:
+    """
+    Parse JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity which json.dump may have written
+            return json.loads(data)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 class ObjectStorage:
     """
@@ -261,15 +289,13 @@ class ObjectStorage:
         if not mesh_json_path.exists():
             raise FileNotFoundError(f"mesh.json not found for mesh: {mesh_hash}")
 
-        with open(mesh_json_path, 'r', encoding='utf-8') as f:
-            mesh_json = json.load(f)
+        mesh_json = load_json_file(mesh_json_path)
 
         # Load material.json
         material_json_path = mesh_dir / "material.json"
         material_json = {}
         if material_json_path.exists():
-            with open(material_json_path, 'r', encoding='utf-8') as f:
-                material_json = json.load(f)
+            material_json = load_json_file(material_json_path)
 
         return {
             'mesh_json': mesh_json,
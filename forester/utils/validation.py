@@ -4,6 +4,12 @@ Validation utilities for Forester.
 
 from typing import Tuple, Optional
 
+# Forbidden patterns in reporting order: the first one found is named in the error message
+_FORBIDDEN_PATTERNS = ('..', '~', '^', ':', '?', '*', '[', '\\')
+
+# Deletion table for the single forbidden characters and control characters
+_FORBIDDEN_CHARS = str.maketrans('', '', '~^:?*[\\' + ''.join(map(chr, range(32))))
+
 
 def validate_branch_name(name: str) -> Tuple[bool, Optional[str]]:
     """
@@ -23,21 +29,21 @@ def validate_branch_name(name: str) -> Tuple[bool, Optional[str]]:
     if len(name) > 255:
         return False, "Branch name too long (max 255 characters)"
 
-    # Check for forbidden patterns
-    forbidden_patterns = ['..', '~', '^', ':', '?', '*', '[', '\\']
-    for pattern in forbidden_patterns:
-        if pattern in name:
-            return False, f"Branch name cannot contain '{pattern}'"
+    # Fast path: one translate() pass finds out whether any forbidden character is present
+    has_forbidden = '..' in name or len(name.translate(_FORBIDDEN_CHARS)) != len(name)
+    if has_forbidden:
+        for pattern in _FORBIDDEN_PATTERNS:
+            if pattern in name:
+                return False, f"Branch name cannot contain '{pattern}'"
 
     # Check for leading/trailing dots or spaces
-    if name.startswith('.') or name.endswith('.'):
-        return False, "Branch name cannot start or end with '.'"
-
-    if name.startswith(' ') or name.endswith(' '):
+    if name.startswith(('.', ' ')) or name.endswith(('.', ' ')):
+        if name[0] == '.' or name[-1] == '.':
+            return False, "Branch name cannot start or end with '.'"
         return False, "Branch name cannot start or end with space"
 
-    # Check for control characters
-    if any(ord(c) < 32 for c in name):
+    # Only control characters are left once the patterns above did not match
+    if has_forbidden:
         return False, "Branch name cannot contain control characters"
 
     return True, None
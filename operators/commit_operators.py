@@ -26,7 +26,12 @@ from ..forester.commands.tag import create_tag
 from ..forester.core.refs import get_branch_ref, get_current_branch
 from ..forester.core.database import ForesterDB
 from .mesh_io import export_mesh_to_json
-from .operator_helpers import get_repository_path, process_meshes_sequentially, is_repository_initialized
+from .operator_helpers import (
+    get_repository_path,
+    process_meshes_sequentially,
+    is_repository_initialized,
+    clear_repository_caches,
+)
 
 
 class DF_OT_create_project_commit(Operator):
@@ -174,6 +179,7 @@ class DF_OT_create_mesh_commit(Operator):
             # Initialize repository
             try:
                 init_repository(project_root)
+                clear_repository_caches()
                 repo_path = project_root
                 self.report({'INFO'}, "Repository initialized")
             except Exception as e:
@@ -273,7 +279,7 @@ class DF_OT_create_mesh_commit(Operator):
             commit_hash = create_mesh_only_commit(
                 repo_path=repo_path,
                 mesh_data_list=mesh_data_list,
-                export_options=export_options,
+                export_options=dict(export_options),  # Stored as JSON; get_export_options() is read-only
                 message=props.message or "No message",
                 author=default_author,
                 screenshot_hash=screenshot_hash
@@ -388,10 +394,16 @@ class DF_OT_refresh_history(Operator):
                         selected_names = []
                 if selected_names:
                     commit_item.selected_mesh_names = ", ".join(selected_names)
+                    # Parsed once here so the history panel doesn't re-parse on every redraw
+                    for mesh_name in selected_names:
+                        commit_item.mesh_names.add().name = mesh_name
                 
                 # Add screenshot_hash
                 screenshot_hash_val = commit_data.get('screenshot_hash')
                 commit_item.screenshot_hash = screenshot_hash_val if screenshot_hash_val else ''
+                
+                # Format the list row once here instead of on every redraw
+                commit_item.update_display()
             
             filter_msg = f" (filtered by tag: '{tag_filter}')" if tag_filter else ""
             self.report({'INFO'}, f"Loaded {len(commits_data)} commits from branch '{branch_name}'{filter_msg}")
@@ -483,6 +495,9 @@ class DF_OT_refresh_branches(Operator):
                 else:
                     branch_item.last_commit_hash = ''
                     branch_item.last_commit_message = 'No commits'
+                
+                # Format the list row once here instead of on every redraw
+                branch_item.update_display()
             
             # Update the list index to point to the current branch (only if requested)
             if self.update_index and hasattr(context.scene, 'df_branch_list_index'):
@@ -794,6 +809,7 @@ class DF_OT_init_project(Operator):
         
         try:
             init_repository(project_root)
+            clear_repository_caches()
             self.report({'INFO'}, "Repository initialized successfully")
             # Refresh branches after initialization
             bpy.ops.df.refresh_branches()
@@ -905,3 +921,33 @@ class DF_OT_garbage_collect(Operator):
             logger.error(f"Failed to garbage collect: {e}", exc_info=True)
             return {'CANCELLED'}
 
+
+class DF_OT_auto_garbage_collect(Operator):
+    """Run automatic garbage collection on the next timer tick."""
+    bl_idname = "df.auto_garbage_collect"
+    bl_label = "Auto Garbage Collect"
+    bl_description = "Run scheduled garbage collection after the current operation has finished"
+    bl_options = {'INTERNAL'}
+    
+    repo_path: StringProperty(name="Repository Path")
+    
+    _timer = None
+    
+    def invoke(self, context, event):
+        """Start the timer; garbage collection runs on its first tick."""
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        """Run garbage collection once, on the first timer event."""
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+        
+        from .operator_helpers import run_auto_garbage_collect
+        run_auto_garbage_collect(context, Path(self.repo_path))
+        return {'FINISHED'}
@@ -26,6 +26,7 @@ from .operator_helpers import (
     cleanup_old_compare_temp,
     copy_project_textures_for_compare,
 )
+from ..properties.properties import COMPARISON_AXIS_ITEMS
 from ..forester.utils.mesh_diff_utils import compute_mesh_diff
 from ..forester.models.mesh_diff import MeshDiff
 
@@ -660,11 +661,7 @@ class DF_OT_compare_mesh(Operator):
     axis: bpy.props.EnumProperty(
         name="Axis",
         description="Axis for comparison object offset",
-        items=[
-            ('X', 'X', 'Offset along X axis'),
-            ('Y', 'Y', 'Offset along Y axis'),
-            ('Z', 'Z', 'Offset along Z axis'),
-        ],
+        items=COMPARISON_AXIS_ITEMS,
         default='X',
     )
     
@@ -5,8 +5,10 @@ Contains functions for exporting and importing meshes with materials and texture
 
 import bpy
 import os
-import json
+import stat
 import logging
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -15,6 +17,8 @@ logger = logging.getLogger(__name__)
 # Constants
 MAX_TEXTURE_SIZE_MB = 50
 FILE_READ_CHUNK_SIZE = 8192
+TEXTURE_PREFETCH_CHUNK_SIZE = 1024 * 1024
+TEXTURE_PREFETCH_WORKERS = 4
 DEFAULT_COMPARISON_OFFSET = 2.0
 
 # Node type mapping for special cases where simple conversion doesn't work
@@ -31,6 +35,23 @@ NODE_TYPE_MAP = {
     # Add more special cases as needed
 }
 
+# Resolved node class names, seeded with the special cases and grown lazily
+_TYPE_NAME_CACHE: Dict[str, str] = dict(NODE_TYPE_MAP)
+_TYPE_NAME_CACHE['TEX_IMAGE'] = 'ShaderNodeTexImage'
+
+# RNA property identifiers per node class, used instead of per-node hasattr probes
+_NODE_ATTR_CACHE: Dict[type, frozenset] = {}
+
+# Prepared property setters per (node class, property keys) signature
+_SETTER_CACHE: Dict[tuple, tuple] = {}
+
+# Images loaded during the current import operation, keyed by resolved absolute path.
+# Cleared by clear_image_cache() at the start of every top-level import.
+_IMAGE_CACHE: Dict[str, Any] = {}
+
+# Modification time of each texture file when it was last (re)loaded, kept for the session
+_IMAGE_MTIMES: Dict[str, float] = {}
+
 
 # ========== EXPORT FUNCTIONS ==========
 
@@ -56,7 +77,7 @@ def export_mesh_to_json(obj, export_options):
     # Faces
     if export_options.get('faces', True):
         if mesh.polygons:
-            mesh_json['faces'] = [[v for v in face.vertices] for face in mesh.polygons]
+            mesh_json['faces'] = _export_faces(mesh)
         elif mesh.loops:
             # Fallback for older mesh format
             mesh_json['faces'] = []
@@ -135,6 +156,31 @@ def export_mesh_to_json(obj, export_options):
     }
 
 
+def _export_faces(mesh):
+    """
+    Export polygon vertex indices as a list of lists.
+
+    Reads loop data in bulk via foreach_get and slices it per polygon
+    instead of iterating face.vertices through RNA.
+    """
+    npoly = len(mesh.polygons)
+    loop_start = np.empty(npoly, dtype=np.int32)
+    loop_total = np.empty(npoly, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    
+    vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_indices)
+    
+    # Fast path: all triangles (or all quads) in loop order
+    if npoly and (loop_total == loop_total[0]).all():
+        size = int(loop_total[0])
+        if size * npoly == len(vertex_indices) and (loop_start == np.arange(npoly) * size).all():
+            return vertex_indices.reshape(-1, size).tolist()
+    
+    return [vertex_indices[s:s + t].tolist() for s, t in zip(loop_start.tolist(), loop_total.tolist())]
+
+
 def export_node_tree_structure(node_tree, textures_info=None):
     """
     Экспортирует структуру node tree с информацией о текстурах для TEX_IMAGE узлов.
@@ -367,6 +413,44 @@ def get_socket_default_value(socket):
 
 # ========== IMPORT FUNCTIONS ==========
 
+def clear_image_cache():
+    """Forget images memoized by previous texture imports."""
+    _IMAGE_CACHE.clear()
+
+
+def _refresh_image(image, path: str, mtime: float) -> None:
+    """
+    Point existing image at path, reloading only when needed.
+    
+    reload() re-decodes the file and re-uploads it to the GPU, so it is skipped
+    when the path is unchanged and the file is not newer than the last load.
+    """
+    if image.filepath != path:
+        image.filepath = path
+    elif mtime <= _IMAGE_MTIMES.get(path, 0.0):
+        return
+    image.reload()
+    _IMAGE_MTIMES[path] = mtime
+
+
+def _get_cached_image(path: str):
+    """
+    Get image loaded earlier in this import operation.
+    
+    Returns:
+        bpy.types.Image or None if not cached or removed from bpy.data since
+    """
+    image = _IMAGE_CACHE.get(path)
+    if image is None:
+        return None
+    try:
+        image.name  # Raises ReferenceError if the datablock was removed
+    except ReferenceError:
+        del _IMAGE_CACHE[path]
+        return None
+    return image
+
+
 def load_mesh_from_commit(repo_path: Path, commit_hash: str, mesh_name: str) -> Tuple[Optional[Dict], Optional[Dict], Optional[Path]]:
     """
     Load mesh from commit with storage path for texture loading.
@@ -375,7 +459,7 @@ def load_mesh_from_commit(repo_path: Path, commit_hash: str, mesh_name: str) ->
         Tuple of (mesh_json, material_json, mesh_storage_path) or (None, None, None) if not found
     """
     from ..forester.core.database import ForesterDB
-    from ..forester.core.storage import ObjectStorage
+    from ..forester.core.storage import ObjectStorage, load_json_file
     from ..forester.models.commit import Commit
     from ..forester.models.mesh import Mesh
     
@@ -421,8 +505,7 @@ def load_mesh_from_commit(repo_path: Path, commit_hash: str, mesh_name: str) ->
             if material_json_path.exists():
                 # Reload material.json from disk to get latest version with updated node_data
                 try:
-                    with open(material_json_path, 'r', encoding='utf-8') as f:
-                        updated_material_json = json.load(f)
+                    updated_material_json = load_json_file(material_json_path)
                     # Use updated version if it has node_tree
                     if 'node_tree' in updated_material_json:
                         mesh.material_json = updated_material_json
@@ -448,6 +531,9 @@ def import_mesh_to_blender(context, mesh_json, material_json, obj_name: str, mod
         mesh_storage_path: Path to mesh storage directory (for loading textures)
         material_prefix: Optional prefix to add to material name (e.g., "_compare_")
     """
+    # Images are memoized per import operation only
+    clear_image_cache()
+    
     if mode == 'NEW':
         # Create new mesh and object
         mesh = bpy.data.meshes.new(obj_name)
@@ -472,11 +558,9 @@ def import_mesh_to_blender(context, mesh_json, material_json, obj_name: str, mod
             faces = [tuple(f) for f in mesh_json['faces']]
         
         # Создаем меш из вершин и полигонов
+        # (from_pydata already calculates edges; normals are refreshed by the final mesh.update())
         mesh.from_pydata(vertices, [], faces)
         
-        # Обновляем нормали для корректного отображения
-        mesh.update()
-        
         # Создаем UV слой если есть UV данные
         if 'uv' in mesh_json and mesh_json['uv'] and len(mesh_json['uv']) > 0:
             # Создаем UV слой если его нет
@@ -514,11 +598,14 @@ def import_mesh_to_blender(context, mesh_json, material_json, obj_name: str, mod
             if mat.node_tree:
                 mat.node_tree.nodes.clear()
         
-        mat.use_nodes = material_json.get('use_nodes', True)
+        # Only write use_nodes when it changes - every write triggers a node tree update
+        use_nodes = material_json.get('use_nodes', True)
+        if mat.use_nodes != use_nodes:
+            mat.use_nodes = use_nodes
         
         # Ensure node_tree exists (Blender creates it automatically when use_nodes=True)
         # But we need to make sure it's there before we clear/import
-        if mat.use_nodes and not mat.node_tree:
+        if mat.use_nodes and mat.node_tree is None:
             # Force node_tree creation (shouldn't happen, but just in case)
             mat.use_nodes = False
             mat.use_nodes = True
@@ -543,7 +630,7 @@ def import_mesh_to_blender(context, mesh_json, material_json, obj_name: str, mod
         
         mesh.materials.append(mat)
     
-    # Final mesh update
+    # Final mesh update - the only explicit mesh.update() during import
     mesh.update()
     
     if mode == 'NEW':
@@ -571,13 +658,19 @@ def import_node_tree_structure(node_tree, node_tree_data, textures_info=None, me
         logger.error("node_tree is None or invalid")
         return
     
-    logger.debug(f"Importing node tree structure. nodes count: {len(node_tree_data.get('nodes', []))}, textures_info: {len(textures_info) if textures_info else 0}, mesh_storage_path: {mesh_storage_path}")
+    # Evaluated once - per-node debug formatting is skipped entirely unless enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Importing node tree structure. nodes count: {len(node_tree_data.get('nodes', []))}, textures_info: {len(textures_info) if textures_info else 0}, mesh_storage_path: {mesh_storage_path}")
     
     # Clear existing nodes (like in difference_engine)
     node_tree.nodes.clear()
     
-    # Track created nodes for linking
+    # Track created nodes and their sockets for linking
     created_nodes = {}
+    node_sockets = {}
+    # Curve mappings are updated once after the whole tree is built
+    deferred_mappings = []
     
     # Build texture lookup map by node name
     # Build it even if mesh_storage_path is missing - we'll still try to load from original paths
@@ -587,194 +680,313 @@ def import_node_tree_structure(node_tree, node_tree_data, textures_info=None, me
             node_name = tex_info.get('node_name')
             if node_name:
                 texture_map[node_name] = tex_info
-                logger.debug(f"Added texture to map: node_name={node_name}, copied={tex_info.get('copied')}, commit_path={tex_info.get('commit_path')}, original_path={tex_info.get('original_path')}")
+                if debug:
+                    logger.debug(f"Added texture to map: node_name={node_name}, copied={tex_info.get('copied')}, commit_path={tex_info.get('commit_path')}, original_path={tex_info.get('original_path')}")
     
     # Get textures directory
+    # Note: TEX_IMAGE nodes are still created if textures_dir doesn't exist,
+    # alternative paths (original_path, etc.) are tried instead
     textures_dir = None
     if mesh_storage_path:
         textures_dir = mesh_storage_path / "textures"
-        logger.debug(f"Textures directory: {textures_dir}, exists: {textures_dir.exists() if textures_dir else False}")
+        if debug:
+            logger.debug(f"Textures directory: {textures_dir}, exists: {textures_dir.exists()}")
+        if not textures_dir.exists():
+            textures_dir = None
     
-    # Create nodes
-    for node_data in node_tree_data.get('nodes', []):
-        original_type = node_data.get('type', 'BSDF_PRINCIPLED')
-        
-        # Convert node type from internal format to class name
-        if original_type.startswith('ShaderNode'):
-            # Already in correct format
-            node_type = original_type
-        elif original_type in NODE_TYPE_MAP:
-            # Use explicit mapping for special cases
-            node_type = NODE_TYPE_MAP[original_type]
-        else:
-            # Convert using simple pattern: BSDF_PRINCIPLED -> ShaderNodeBsdfPrincipled
-            # Special case for TEX_IMAGE
+    # Resolve texture paths up front and start reading the files in background threads,
+    # so disk I/O overlaps with node creation. Images are still loaded on the main thread.
+    blend_dir = os.path.dirname(bpy.data.filepath) or None
+    texture_prefetch, executor = _start_texture_prefetch(node_tree_data, texture_map, textures_dir, blend_dir)
+    
+    try:
+        # Create nodes
+        for node_data in node_tree_data.get('nodes', []):
+            original_type = node_data.get('type', 'BSDF_PRINCIPLED')
+            
+            # Convert node type from internal format to class name
+            node_type = _node_type_name(original_type)
+            
+            try:
+                node = node_tree.nodes.new(type=node_type)
+                if debug:
+                    logger.debug(f"Created node: {node.name} (type: {node_type}, original: {original_type})")
+            except Exception as e:
+                logger.error(f"Failed to create node type '{node_type}' (from '{original_type}'): {e}")
+                continue
+            
+            # Set node properties safely
+            if 'name' in node_data:
+                node.name = node_data['name']
+                
+            if 'location' in node_data:
+                loc = node_data['location']
+                if isinstance(loc, (list, tuple)) and len(loc) >= 2:
+                    node.location = [float(loc[0]), float(loc[1])]  # Only use X, Y
+                    
+            if 'width' in node_data:
+                width = node_data['width']
+                if isinstance(width, (int, float)):
+                    node.width = float(width)
+            
+            # Handle image texture nodes FIRST (before other properties that depend on image being loaded)
+            # The function will try to load the texture but won't fail if it can't find it
             if original_type == 'TEX_IMAGE':
-                node_type = 'ShaderNodeTexImage'
-            else:
-                parts = original_type.split('_')
-                formatted_name = ''.join(word.capitalize() for word in parts)
-                node_type = f'ShaderNode{formatted_name}'
-        
-        try:
-            node = node_tree.nodes.new(type=node_type)
-            logger.debug(f"Created node: {node.name} (type: {node_type}, original: {original_type})")
-        except Exception as e:
-            logger.error(f"Failed to create node type '{node_type}' (from '{original_type}'): {e}")
-            continue
+                if debug:
+                    logger.debug(f"Importing image texture node: {node.name}, textures_dir: {textures_dir}")
+                prefetched = texture_prefetch.get(id(node_data))
+                if prefetched is None:
+                    # Unnamed in the export: its texture is keyed by the name Blender gave the node
+                    prefetched = _resolve_texture_path(node_data, texture_map.get(node.name), textures_dir, blend_dir) + (None,)
+                _import_image_texture(node, node_data, prefetched)
+                if debug:
+                    logger.debug(f"Finished importing image texture node: {node.name}, has image: {hasattr(node, 'image') and node.image is not None}")
+            
+            # Restore node properties (AFTER image is loaded for TEX_IMAGE nodes)
+            if 'properties' in node_data:
+                _import_node_properties(node, node_data['properties'], deferred_mappings)
+            
+            # Set input default values
+            if 'inputs' in node_data:
+                for i, input_data in enumerate(node_data['inputs']):
+                    if i < len(node.inputs):
+                        default_value = input_data.get('default_value')
+                        if default_value is not None:
+                            try:
+                                if isinstance(default_value, list):
+                                    node.inputs[i].default_value = tuple(default_value)
+                                else:
+                                    node.inputs[i].default_value = default_value
+                            except (TypeError, AttributeError, ValueError) as e:
+                                # Some sockets might not accept the value or wrong size
+                                pass
+            
+            node_key = node_data.get('name', node.name)
+            created_nodes[node_key] = node
+            # Index sockets by name once so link wiring is O(1) per link
+            node_sockets[node_key] = (_index_sockets(node.inputs), _index_sockets(node.outputs))
         
-        # Set node properties safely
-        if 'name' in node_data:
-            node.name = node_data['name']
+        # Create node links (connections between nodes)
+        # Links are validated with plain lookups; only the link creation itself can raise
+        for link_data in node_tree_data.get('links', []):
+            from_sockets = node_sockets.get(link_data.get('from_node'))
+            to_sockets = node_sockets.get(link_data.get('to_node'))
+            if not (from_sockets and to_sockets):
+                continue
             
-        if 'location' in node_data:
-            loc = node_data['location']
-            if isinstance(loc, (list, tuple)) and len(loc) >= 2:
-                node.location = [float(loc[0]), float(loc[1])]  # Only use X, Y
-                
-        if 'width' in node_data:
-            width = node_data['width']
-            if isinstance(width, (int, float)):
-                node.width = float(width)
-        
-        # Handle image texture nodes FIRST (before other properties that depend on image being loaded)
-        # Note: We create TEX_IMAGE nodes even if textures_dir doesn't exist
-        # The function will try to load the texture but won't fail if it can't find it
-        if original_type == 'TEX_IMAGE':
-            logger.debug(f"Importing image texture node: {node.name}, textures_dir: {textures_dir}")
-            _import_image_texture(node, node_data, texture_map, textures_dir)
-            logger.debug(f"Finished importing image texture node: {node.name}, has image: {hasattr(node, 'image') and node.image is not None}")
-        
-        # Restore node properties (AFTER image is loaded for TEX_IMAGE nodes)
-        if 'properties' in node_data:
-            _import_node_properties(node, node_data['properties'])
-        
-        # Set input default values
-        if 'inputs' in node_data:
-            for i, input_data in enumerate(node_data['inputs']):
-                if i < len(node.inputs):
-                    default_value = input_data.get('default_value')
-                    if default_value is not None:
-                        try:
-                            if isinstance(default_value, list):
-                                node.inputs[i].default_value = tuple(default_value)
-                            else:
-                                node.inputs[i].default_value = default_value
-                        except (TypeError, AttributeError, ValueError) as e:
-                            # Some sockets might not accept the value or wrong size
-                            pass
-        
-        created_nodes[node_data.get('name', node.name)] = node
-    
-    # Create node links (connections between nodes)
-    for link_data in node_tree_data.get('links', []):
-        try:
-            from_node = created_nodes.get(link_data['from_node'])
-            to_node = created_nodes.get(link_data['to_node'])
+            from_socket = from_sockets[1].get(link_data.get('from_socket'))
+            to_socket = to_sockets[0].get(link_data.get('to_socket'))
             
-            if from_node and to_node:
-                from_socket = None
-                to_socket = None
-                
-                # Find the output socket
-                for output in from_node.outputs:
-                    if output.name == link_data['from_socket']:
-                        from_socket = output
-                        break
-                
-                # Find the input socket
-                for input_socket in to_node.inputs:
-                    if input_socket.name == link_data['to_socket']:
-                        to_socket = input_socket
-                        break
-                
-                # Create the link
-                if from_socket and to_socket:
+            # Create the link; a failed link must not skip the ones after it
+            if from_socket and to_socket:
+                try:
                     node_tree.links.new(from_socket, to_socket)
-        except Exception as e:
-            logger.warning(f"Failed to create link: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to create link: {e}")
+    finally:
+        # Stop outstanding reads even if node creation failed part-way
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Single update pass for everything changed above
+    for mapping in deferred_mappings:
+        mapping.update()
+    node_tree.update_tag()
+
+
+def _node_type_name(original_type):
+    """Convert exported node type (e.g. BSDF_PRINCIPLED) to its class name (ShaderNodeBsdfPrincipled)"""
+    node_type = _TYPE_NAME_CACHE.get(original_type)
+    if node_type is None:
+        if original_type.startswith('ShaderNode'):
+            # Already in correct format
+            node_type = original_type
+        else:
+            node_type = 'ShaderNode' + ''.join(word.capitalize() for word in original_type.split('_'))
+        _TYPE_NAME_CACHE[original_type] = node_type
+    return node_type
 
 
-def _import_image_texture(node, node_data, texture_map, textures_dir):
-    """Import image texture node with multiple path resolution strategies"""
-    # Note: We don't return early if textures_dir doesn't exist
-    # The node is already created, we just try to load the image
-    # If textures_dir is missing, we'll try alternative paths (original_path, etc.)
-    if not textures_dir or not textures_dir.exists():
-        logger.debug(f"Textures directory doesn't exist: {textures_dir}, trying alternative paths")
-        # Don't return - continue to try alternative paths
-        textures_dir = None
+def _index_sockets(sockets):
+    """Map socket name to socket, keeping the first socket for duplicate names"""
+    index = {}
+    for socket in sockets:
+        index.setdefault(socket.name, socket)
+    return index
+
+
+def _abspath(path: str, blend_dir: Optional[str]) -> str:
+    """Resolve Blender-relative '//' path against a precomputed blend file directory"""
+    if path.startswith('//'):
+        if blend_dir:
+            return os.path.normpath(os.path.join(blend_dir, path[2:]))
+        # Unsaved blend file: bpy.path.abspath() leaves the path relative to the working directory
+        return path[2:]
+    return path
+
+
+def _iter_texture_candidates(node_data, texture_info, textures_dir, blend_dir=None):
+    """
+    Yield candidate texture paths in priority order.
     
-    # Build candidate paths (like in difference_engine)
-    candidate_paths = []
-    node_name = node_data.get('name', node.name)
-    texture_info = texture_map.get(node_name)
+    Candidates are built lazily so that later (more expensive) ones are never
+    computed when an earlier candidate already resolves. blend_dir is the
+    directory of the current blend file, used to resolve '//' relative paths.
+    """
+    textures_dir_str = str(textures_dir) if textures_dir else None
     
     # 1. Try copied_texture from node_data (primary method, like in difference_engine)
-    if 'copied_texture' in node_data and textures_dir:
+    if 'copied_texture' in node_data and textures_dir_str:
         copied_tex = node_data['copied_texture']
         # Handle both cases: just filename or path with "textures/"
         if copied_tex.startswith('textures/'):
             # Remove "textures/" prefix and use just filename
             copied_tex = copied_tex.replace('textures/', '', 1)
-        candidate_paths.append(os.path.join(str(textures_dir), copied_tex))
+        yield os.path.join(textures_dir_str, copied_tex)
     
     # 2. Try texture_info from texture_map (for backward compatibility)
-    if texture_info:
-        if textures_dir:
-            if texture_info.get('copied') and texture_info.get('commit_path'):
-                commit_path = texture_info['commit_path']
-                if commit_path.startswith('textures/'):
-                    commit_path = commit_path.replace('textures/', '', 1)
-                candidate_paths.append(str(textures_dir / commit_path))
-            if texture_info.get('original_path'):
-                original_basename = os.path.basename(texture_info['original_path'])
-                candidate_paths.append(str(textures_dir / original_basename))
+    if texture_info and textures_dir_str:
+        if texture_info.get('copied') and texture_info.get('commit_path'):
+            commit_path = texture_info['commit_path']
+            if commit_path.startswith('textures/'):
+                commit_path = commit_path.replace('textures/', '', 1)
+            yield os.path.join(textures_dir_str, commit_path)
+        if texture_info.get('original_path'):
+            yield os.path.join(textures_dir_str, os.path.basename(texture_info['original_path']))
     
     # 3. Try image_file from node_data (like in difference_engine)
     if 'image_file' in node_data:
         image_file = node_data['image_file']
-        if textures_dir:
-            candidate_paths.append(os.path.join(str(textures_dir), os.path.basename(image_file)))
+        if textures_dir_str:
+            yield os.path.join(textures_dir_str, os.path.basename(image_file))
         # Always try absolute path (works even if textures_dir doesn't exist)
-        candidate_paths.append(bpy.path.abspath(image_file))
+        yield _abspath(image_file, blend_dir)
     
     # 4. Try original path from texture_info (for backward compatibility)
     if texture_info and texture_info.get('original_path'):
-        abs_path = bpy.path.abspath(texture_info['original_path'])
-        candidate_paths.append(abs_path)
+        yield _abspath(texture_info['original_path'], blend_dir)
+
+
+def _resolve_texture_path(node_data, texture_info, textures_dir, blend_dir=None):
+    """
+    Find the first existing texture file for a TEX_IMAGE node.
+    
+    Returns:
+        Tuple of (resolved_path, stat_result, tried_candidates);
+        resolved_path and stat_result are None if nothing was found
+    """
+    candidate_paths = []
+    for candidate in _iter_texture_candidates(node_data, texture_info, textures_dir, blend_dir):
+        if not candidate or not isinstance(candidate, str):
+            continue
+        candidate_paths.append(candidate)
+        # Single stat per candidate
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            return candidate, st, candidate_paths
+    return None, None, candidate_paths
+
+
+def _prefetch_file(path: str) -> None:
+    """Read file once so that the later main-thread image load hits the OS page cache"""
+    try:
+        with open(path, 'rb') as f:
+            while f.read(TEXTURE_PREFETCH_CHUNK_SIZE):
+                pass
+    except OSError as e:
+        logger.debug(f"Texture prefetch failed for {path}: {e}")
+
+
+def _start_texture_prefetch(node_tree_data, texture_map, textures_dir, blend_dir=None):
+    """
+    Resolve paths of all TEX_IMAGE nodes and submit background reads for the ones not loaded yet.
+    
+    Returns:
+        Tuple of (prefetch, executor) where prefetch maps id(node_data) to
+        (resolved_path, stat_result, tried_candidates, future). executor is None
+        if there is nothing to read.
+    """
+    prefetch = {}
+    futures_by_path = {}
+    executor = None
+    
+    for node_data in node_tree_data.get('nodes', []):
+        # Unnamed nodes are resolved after creation, once node.name is known
+        if node_data.get('type') != 'TEX_IMAGE' or 'name' not in node_data:
+            continue
+        texture_info = texture_map.get(node_data['name'])
+        resolved_path, resolved_stat, candidate_paths = _resolve_texture_path(
+            node_data, texture_info, textures_dir, blend_dir
+        )
+        
+        future = None
+        # Images already in bpy.data are reused by name without reading the file, so only
+        # textures that will actually be loaded are read ahead
+        if (resolved_path and _get_cached_image(resolved_path) is None
+                and bpy.data.images.get(os.path.basename(resolved_path)) is None):
+            future = futures_by_path.get(resolved_path)
+            if future is None:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=TEXTURE_PREFETCH_WORKERS)
+                future = executor.submit(_prefetch_file, resolved_path)
+                futures_by_path[resolved_path] = future
+        
+        prefetch[id(node_data)] = (resolved_path, resolved_stat, candidate_paths, future)
+    
+    return prefetch, executor
+
+
+def _import_image_texture(node, node_data, prefetched):
+    """
+    Import image texture node with multiple path resolution strategies.
     
-    # Resolve first existing path
-    resolved_path = None
-    for candidate in candidate_paths:
-        if candidate and isinstance(candidate, str) and os.path.exists(candidate) and os.path.isfile(candidate):
-            resolved_path = candidate
-            break
+    Args:
+        node: Created TEX_IMAGE node
+        node_data: Node data from JSON
+        prefetched: Entry from _start_texture_prefetch for this node
+    """
+    node_name = node_data.get('name', node.name)
+    resolved_path, resolved_stat, candidate_paths, prefetch_future = prefetched
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     if not resolved_path:
         logger.warning(f"Texture not found for node '{node_name}'. Tried: {candidate_paths}")
     else:
         try:
-            file_size_mb = os.path.getsize(resolved_path) / (1024 * 1024)
+            file_size_mb = resolved_stat.st_size / (1024 * 1024)
             if file_size_mb > MAX_TEXTURE_SIZE_MB:
                 logger.warning(f"Loading large texture: {os.path.basename(resolved_path)} ({file_size_mb:.1f} MB)")
             
-            # Reuse cached image by filename when possible (like in difference_engine)
             cached_name = os.path.basename(resolved_path)
-            image = bpy.data.images.get(cached_name)
+            image = _get_cached_image(resolved_path)
             if image:
-                logger.debug(f"Reusing cached texture: {cached_name}")
-                image.filepath = resolved_path
-                # Force reload to ensure up-to-date display
-                image.reload()
+                if debug:
+                    logger.debug(f"Reusing texture loaded in this import: {cached_name}")
             else:
-                image = bpy.data.images.load(resolved_path)
-                logger.debug(f"Loaded new texture from {resolved_path}")
+                # Reuse cached image by filename when possible (like in difference_engine)
+                image = bpy.data.images.get(cached_name)
+                if image:
+                    if debug:
+                        logger.debug(f"Reusing cached texture: {cached_name}")
+                    _refresh_image(image, resolved_path, resolved_stat.st_mtime)
+                else:
+                    # Wait for the background read so the load decodes from the page cache
+                    if prefetch_future is not None:
+                        prefetch_future.result()
+                    image = bpy.data.images.load(resolved_path)
+                    _IMAGE_MTIMES[resolved_path] = resolved_stat.st_mtime
+                    if debug:
+                        logger.debug(f"Loaded new texture from {resolved_path}")
+                _IMAGE_CACHE[resolved_path] = image
             
             # Assign image to node
             if hasattr(node, 'image'):
                 node.image = image
-                logger.debug(f"Assigned texture {cached_name} to node {node.name}")
+                if debug:
+                    logger.debug(f"Assigned texture {cached_name} to node {node.name}")
             else:
                 logger.error(f"Node {node.name} doesn't have 'image' attribute!")
         except (OSError, ValueError, PermissionError) as e:
@@ -783,104 +995,163 @@ def _import_image_texture(node, node_data, texture_map, textures_dir):
             logger.error(f"Unexpected error loading texture {resolved_path}: {e}", exc_info=True)
 
 
-def _import_node_properties(node, props):
-    """Import node properties including ColorRamp, Curve, Node Groups"""
-    # Common properties
-    if 'operation' in props and hasattr(node, 'operation'):
-        node.operation = props['operation']
-    if 'blend_type' in props and hasattr(node, 'blend_type'):
-        node.blend_type = props['blend_type']
-    if 'interpolation' in props and hasattr(node, 'interpolation'):
-        try:
-            node.interpolation = props['interpolation']
-        except Exception as e:
-            logger.warning(f"Failed to set interpolation: {e}")
-    if 'extension' in props and hasattr(node, 'extension'):
-        try:
-            node.extension = props['extension']
-        except Exception as e:
-            logger.warning(f"Failed to set extension: {e}")
-    if 'color_space' in props and hasattr(node, 'color_space'):
-        try:
-            node.color_space = props['color_space']
-        except Exception as e:
-            logger.warning(f"Failed to set color_space: {e}")
-    if 'label' in props:
-        node.label = props['label']
-    if 'hide' in props:
-        node.hide = props['hide']
-    if 'mute' in props:
-        node.mute = props['mute']
-    
-    # Node Group restoration
-    if 'node_tree_name' in props and hasattr(node, 'node_tree'):
-        node_tree_name = props['node_tree_name']
-        # Try to find the node group in the blend file
-        if node_tree_name in bpy.data.node_groups:
-            node.node_tree = bpy.data.node_groups[node_tree_name]
-            logger.debug(f"Restored Group node reference: {node_tree_name}")
-        else:
-            logger.warning(f"Node group '{node_tree_name}' not found in blend file - Group node will be empty")
+def _node_attrs(node) -> frozenset:
+    """Get RNA property identifiers of the node's class (cached per class)"""
+    cls = type(node)
+    attrs = _NODE_ATTR_CACHE.get(cls)
+    if attrs is None:
+        attrs = frozenset(prop.identifier for prop in cls.bl_rna.properties)
+        _NODE_ATTR_CACHE[cls] = attrs
+    return attrs
+
+
+def _import_node_properties(node, props, deferred_mappings=None):
+    """
+    Import node properties including ColorRamp, Curve, Node Groups.
     
-    # ColorRamp restoration
-    if 'color_ramp' in props and hasattr(node, 'color_ramp'):
-        ramp_data = props['color_ramp']
-        ramp = node.color_ramp
+    Only keys present in props are visited, each through its handler in
+    _PROP_HANDLERS. The handler list is prepared once per (node class, property keys)
+    signature, so repeated node shapes skip the lookups and class checks.
+    If deferred_mappings list is given, curve mappings are appended to it
+    instead of being updated immediately.
+    """
+    signature = (type(node), tuple(props))
+    setter = _SETTER_CACHE.get(signature)
+    if setter is None:
+        setter = _compile_setter(node, signature[1])
+        _SETTER_CACHE[signature] = setter
+    
+    for key, handler in setter:
+        handler(node, key, props[key], deferred_mappings)
+
+
+def _compile_setter(node, keys):
+    """
+    Build the (key, handler) steps for a node class and property key set.
+    
+    Plain attribute keys the node class doesn't have are dropped here,
+    so their handlers can assign without checking.
+    """
+    attrs = _node_attrs(node)
+    steps = []
+    for key in keys:
+        handler = _PROP_HANDLERS.get(key)
+        if handler is None:
+            continue
+        if handler in (_set_attr, _set_attr_safe) and key not in attrs:
+            continue
+        steps.append((key, handler))
+    return tuple(steps)
+
+
+def _set_attr(node, key, value, deferred_mappings):
+    """Set plain node property (presence checked by _compile_setter)"""
+    setattr(node, key, value)
+
+
+def _set_attr_safe(node, key, value, deferred_mappings):
+    """Set node property that may reject values from other Blender versions"""
+    try:
+        setattr(node, key, value)
+    except Exception as e:
+        logger.warning(f"Failed to set {key}: {e}")
+
+
+def _restore_node_group(node, key, node_tree_name, deferred_mappings):
+    """Node Group restoration"""
+    if 'node_tree' not in _node_attrs(node):
+        return
+    # Try to find the node group in the blend file
+    if node_tree_name in bpy.data.node_groups:
+        node.node_tree = bpy.data.node_groups[node_tree_name]
+        logger.debug(f"Restored Group node reference: {node_tree_name}")
+    else:
+        logger.warning(f"Node group '{node_tree_name}' not found in blend file - Group node will be empty")
+
+
+def _restore_color_ramp(node, key, ramp_data, deferred_mappings):
+    """ColorRamp restoration"""
+    if 'color_ramp' not in _node_attrs(node):
+        return
+    ramp = node.color_ramp
+    
+    # Set ramp properties
+    if 'color_mode' in ramp_data:
+        ramp.color_mode = ramp_data['color_mode']
+    if 'interpolation' in ramp_data:
+        ramp.interpolation = ramp_data['interpolation']
+    
+    # Restore color stops
+    elements_data = ramp_data.get('elements')
+    if elements_data:
+        # Trim from the end (cheap, no shifting) down to the single element a ramp must keep
+        for i in range(len(ramp.elements) - 1, 0, -1):
+            ramp.elements.remove(ramp.elements[i])
         
-        # Set ramp properties
-        if 'color_mode' in ramp_data:
-            ramp.color_mode = ramp_data['color_mode']
-        if 'interpolation' in ramp_data:
-            ramp.interpolation = ramp_data['interpolation']
-        
-        # Restore color stops
-        if 'elements' in ramp_data:
-            # Clear existing elements (keep at least 2)
-            while len(ramp.elements) > 2:
-                ramp.elements.remove(ramp.elements[0])
-            
-            # Add new elements
-            elements_data = ramp_data['elements']
-            for i, elem_data in enumerate(elements_data):
-                if i < len(ramp.elements):
-                    # Update existing
-                    elem = ramp.elements[i]
-                else:
-                    # Create new
-                    elem = ramp.elements.new(elem_data['position'])
-                
+        # Overwrite the remaining element, then add the rest in one pass
+        for i, elem_data in enumerate(elements_data):
+            if i == 0:
+                elem = ramp.elements[0]
                 elem.position = elem_data['position']
-                if 'color' in elem_data:
-                    elem.color = elem_data['color']
+            else:
+                elem = ramp.elements.new(elem_data['position'])
+            if 'color' in elem_data:
+                elem.color = elem_data['color']
+
+
+def _restore_curve_mapping(node, key, curves_data, deferred_mappings):
+    """Curve restoration (Float, RGB, Vector)"""
+    if 'mapping' not in _node_attrs(node):
+        return
+    mapping = node.mapping
     
-    # Curve restoration (Float, RGB, Vector)
-    if 'mapping' in props and hasattr(node, 'mapping'):
-        curves_data = props['mapping']
-        mapping = node.mapping
-        
-        if 'use_clip' in curves_data and hasattr(mapping, 'use_clip'):
-            mapping.use_clip = curves_data['use_clip']
+    if 'use_clip' in curves_data and hasattr(mapping, 'use_clip'):
+        mapping.use_clip = curves_data['use_clip']
+    
+    if 'curves' in curves_data:
+        for curve_idx, curve_points in enumerate(curves_data['curves']):
+            if curve_idx < len(mapping.curves) and curve_points:
+                curve = mapping.curves[curve_idx]
+                
+                # Trim from the end down to the two points a curve must keep
+                for i in range(len(curve.points) - 1, 1, -1):
+                    curve.points.remove(curve.points[i])
+                
+                # Overwrite the remaining points, then add the rest in one pass
+                kept = len(curve.points)
+                for i, point_data in enumerate(curve_points):
+                    if i < kept:
+                        point = curve.points[i]
+                        point.location = point_data['location'][:2]
+                    else:
+                        point = curve.points.new(point_data['location'][0],
+                                                 point_data['location'][1])
+                    if 'handle_type' in point_data:
+                        point.handle_type = point_data['handle_type']
         
-        if 'curves' in curves_data:
-            for curve_idx, curve_points in enumerate(curves_data['curves']):
-                if curve_idx < len(mapping.curves):
-                    curve = mapping.curves[curve_idx]
-                    
-                    # Clear existing points
-                    while len(curve.points) > 0:
-                        curve.points.remove(curve.points[0])
-                    
-                    # Add points
-                    for point_data in curve_points:
-                        point = curve.points.new(point_data['location'][0], 
-                                                point_data['location'][1])
-                        if 'handle_type' in point_data:
-                            point.handle_type = point_data['handle_type']
-            
-            # Update the mapping
+        # Update the mapping (or leave it to the caller's single update pass)
+        if deferred_mappings is not None:
+            deferred_mappings.append(mapping)
+        else:
             mapping.update()
 
 
+# Exported property key -> handler(node, key, value, deferred_mappings)
+_PROP_HANDLERS = {
+    'operation': _set_attr,
+    'blend_type': _set_attr,
+    'interpolation': _set_attr_safe,
+    'extension': _set_attr_safe,
+    'color_space': _set_attr_safe,
+    'label': _set_attr,
+    'hide': _set_attr,
+    'mute': _set_attr,
+    'node_tree_name': _restore_node_group,
+    'color_ramp': _restore_color_ramp,
+    'mapping': _restore_curve_mapping,
+}
+
+
 def load_textures_to_material(material, textures_info, mesh_storage_path):
     """
     Загружает текстуры в материал.
@@ -894,12 +1165,15 @@ def load_textures_to_material(material, textures_info, mesh_storage_path):
         logger.warning("Material has no node tree")
         return
     
-    logger.debug(f"Loading textures for material: {material.name}")
-    logger.debug(f"Mesh storage path: {mesh_storage_path}")
-    logger.debug(f"Textures info count: {len(textures_info)}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Loading textures for material: {material.name}")
+        logger.debug(f"Mesh storage path: {mesh_storage_path}")
+        logger.debug(f"Textures info count: {len(textures_info)}")
     
     # Debug: log all nodes in material
-    logger.debug(f"Nodes in material: {[n.name + ' (' + n.type + ')' for n in material.node_tree.nodes]}")
+    if debug:
+        logger.debug(f"Nodes in material: {[n.name + ' (' + n.type + ')' for n in material.node_tree.nodes]}")
     
     for texture_info in textures_info:
         node_name = texture_info.get('node_name')
@@ -907,14 +1181,16 @@ def load_textures_to_material(material, textures_info, mesh_storage_path):
             logger.warning("Skipping texture: no node_name")
             continue
         
-        logger.debug(f"Looking for texture node: {node_name}")
+        if debug:
+            logger.debug(f"Looking for texture node: {node_name}")
         
         # Находим узел текстуры в node tree
         texture_node = None
         for node in material.node_tree.nodes:
             if node.name == node_name and node.type == 'TEX_IMAGE':
                 texture_node = node
-                logger.debug(f"Found texture node: {node.name}")
+                if debug:
+                    logger.debug(f"Found texture node: {node.name}")
                 break
         
         if not texture_node:
@@ -926,24 +1202,41 @@ def load_textures_to_material(material, textures_info, mesh_storage_path):
         if texture_info.get('copied') and texture_info.get('commit_path'):
             # Текстура скопирована в коммит
             texture_path = mesh_storage_path / texture_info['commit_path']
-            logger.debug(f"Using copied texture path: {texture_path}")
+            if debug:
+                logger.debug(f"Using copied texture path: {texture_path}")
         elif texture_info.get('original_path'):
             # Используем оригинальный путь
             texture_path = Path(bpy.path.abspath(texture_info['original_path']))
-            logger.debug(f"Using original texture path: {texture_path}")
+            if debug:
+                logger.debug(f"Using original texture path: {texture_path}")
+        
+        # Single stat reused for the existence check, size warning and mtime
+        texture_stat = None
+        if texture_path:
+            try:
+                texture_stat = os.stat(texture_path)
+            except OSError:
+                pass
         
         # Загружаем текстуру
-        if texture_path and texture_path.exists() and texture_path.is_file():
+        if texture_stat and stat.S_ISREG(texture_stat.st_mode):
+            file_size_mb = texture_stat.st_size / (1024 * 1024)
+            if file_size_mb > MAX_TEXTURE_SIZE_MB:
+                logger.warning(f"Loading large texture: {texture_path.name} ({file_size_mb:.1f} MB)")
+            
             # Проверяем, не загружена ли уже эта текстура
             image_name = texture_info.get('image_name', texture_path.name)
-            image = bpy.data.images.get(image_name)
+            image = _get_cached_image(str(texture_path)) or bpy.data.images.get(image_name)
             
             if not image:
                 try:
-                    logger.debug(f"Loading texture: {texture_path}")
+                    if debug:
+                        logger.debug(f"Loading texture: {texture_path}")
                     image = bpy.data.images.load(str(texture_path))
+                    _IMAGE_MTIMES[str(texture_path)] = texture_stat.st_mtime
                     image.name = image_name
-                    logger.debug(f"Texture loaded: {image.name}")
+                    if debug:
+                        logger.debug(f"Texture loaded: {image.name}")
                 except (OSError, ValueError, PermissionError) as e:
                     logger.error(f"Failed to load texture {texture_path}: {e}", exc_info=True)
                     continue
@@ -951,16 +1244,17 @@ def load_textures_to_material(material, textures_info, mesh_storage_path):
                     logger.error(f"Unexpected error loading texture {texture_path}: {e}", exc_info=True)
                     continue
             else:
-                # Обновляем путь если изменился
-                if image.filepath != str(texture_path):
-                    image.filepath = str(texture_path)
-                    image.reload()
-                logger.debug(f"Using existing texture: {image.name}")
+                # Обновляем путь если изменился (или перезагружаем, если файл новее)
+                _refresh_image(image, str(texture_path), texture_stat.st_mtime)
+                if debug:
+                    logger.debug(f"Using existing texture: {image.name}")
+            _IMAGE_CACHE[str(texture_path)] = image
             
             # Назначаем текстуру узлу
             if hasattr(texture_node, 'image'):
                 texture_node.image = image
-                logger.debug(f"Assigned texture {image.name} to node {texture_node.name}")
+                if debug:
+                    logger.debug(f"Assigned texture {image.name} to node {texture_node.name}")
             else:
                 logger.error(f"Texture node {texture_node.name} has no 'image' attribute")
         else:
@@ -968,6 +1262,9 @@ def load_textures_to_material(material, textures_info, mesh_storage_path):
                 logger.warning(f"Texture path does not exist: {texture_path}")
             else:
                 logger.warning(f"No texture path found for node {node_name}")
+    
+    # Tag the tree once after all image assignments
+    material.node_tree.update_tag()
 
 
 # ========== MATERIAL UPDATE HOOK FOR FORESTER ==========
@@ -990,29 +1287,28 @@ def update_blender_node_tree(material_json: Dict[str, Any], textures: List[Dict[
     if 'node_tree' not in material_json or 'nodes' not in material_json['node_tree']:
         return material_json
     
+    # Procedural materials without image textures need no update
+    tex_nodes = [n for n in material_json['node_tree']['nodes'] if n.get('type') == 'TEX_IMAGE']
+    if not tex_nodes or not textures:
+        return material_json
+    
     # Build texture lookup by node_name
-    texture_by_node = {}
-    for tex_info in textures:
-        node_name = tex_info.get('node_name')
-        if node_name:
-            texture_by_node[node_name] = tex_info
+    texture_by_node = {t['node_name']: t for t in textures if t.get('node_name')}
     
     # Update TEX_IMAGE node_data with texture paths
-    for node_data in material_json['node_tree']['nodes']:
-        if node_data.get('type') == 'TEX_IMAGE':
-            node_name = node_data.get('name')
-            texture_info = texture_by_node.get(node_name)
-            
-            if texture_info:
-                # Add copied_texture and image_file to node_data
-                if texture_info.get('copied') and texture_info.get('commit_path'):
-                    # Save only filename (remove "textures/" prefix if present)
-                    commit_path = texture_info['commit_path']
-                    if commit_path.startswith('textures/'):
-                        commit_path = commit_path.replace('textures/', '', 1)
-                    node_data['copied_texture'] = commit_path
-                if texture_info.get('original_path'):
-                    node_data['image_file'] = texture_info['original_path']
+    for node_data in tex_nodes:
+        texture_info = texture_by_node.get(node_data.get('name'))
+        
+        if texture_info:
+            # Add copied_texture and image_file to node_data
+            if texture_info.get('copied') and texture_info.get('commit_path'):
+                # Save only filename (remove "textures/" prefix if present)
+                commit_path = texture_info['commit_path']
+                if commit_path.startswith('textures/'):
+                    commit_path = commit_path.replace('textures/', '', 1)
+                node_data['copied_texture'] = commit_path
+            if texture_info.get('original_path'):
+                node_data['image_file'] = texture_info['original_path']
     
     return material_json
 
@@ -3,39 +3,165 @@ Helper functions for operators to reduce code duplication.
 """
 
 import bpy
+import functools
+import os
 import logging
+import queue
+import shutil
+import threading
 import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, Set
-from ..forester.commands import find_repository, list_branches, init_repository
+from typing import Dict, Optional, Tuple, Set, TYPE_CHECKING
+from ..forester.commands import find_repository, init_repository
 from ..forester.core.refs import get_branch_ref, get_current_branch
 from ..forester.core.database import ForesterDB
+from ..forester.utils.validation import validate_branch_name  # noqa: F401 - re-exported for operators
+
+if TYPE_CHECKING:
+    from ..forester.core.storage import ObjectStorage
 
 logger = logging.getLogger(__name__)
 
+_DFM_DIRNAME = ".DFM"
+_DB_FILENAME = "forester.db"
+
+# find_repository() results per blend file directory, with the .DFM mtime they were validated against;
+# cleared by the load_post/save_post handlers
+_REPO_CACHE: Dict[str, Tuple[Optional[Path], Optional[int]]] = {}
+
+# Branch names per repository, with the mtime of .DFM/refs/branches they were listed at
+_BRANCHES_CACHE: Dict[Path, Tuple[int, Tuple[str, ...]]] = {}
+
+# RepoState per blend file path, with the (.DFM mtime, branch names) it was built from
+_REPO_STATE_CACHE: Dict[str, Tuple[Tuple[Optional[int], Tuple[str, ...]], "RepoState"]] = {}
+
+# is_repository_initialized() result per blend file path, with the .DFM mtime it was checked at
+_INITIALIZED_CACHE: Dict[str, Tuple[Optional[int], bool]] = {}
+
+
+@dataclass(frozen=True)
+class _DefaultPrefs:
+    """Default preference values used when the addon preferences are unavailable."""
+    default_author: str = "Unknown"
+    auto_compress_keep_last_n: int = 5
+    auto_garbage_collect: bool = False
+    gc_interval_value: int = 1
+    gc_interval_unit: str = 'DAYS'
+    gc_last_run: float = 0.0
+
+
+# Shared by every caller, hence frozen
+_DEFAULT_PREFS = _DefaultPrefs()
+
+# Resolved addon id; the AddonPreferences wrapper itself is looked up on every call
+_ADDON_ID: Optional[str] = None
+
+# Background deletion of temp directories (see remove_tree_async)
+_DELETING_PREFIX = ".deleting-"
+_DELETE_QUEUE: "queue.Queue[str]" = queue.Queue()
+_JANITOR_THREAD: Optional[threading.Thread] = None
+# Paths queued and not yet removed, so a sweep does not queue the same tree twice
+_QUEUED_DELETES: Set[str] = set()
+_QUEUED_DELETES_LOCK = threading.Lock()
+
+# ObjectStorage per repository (its constructor mkdirs the object folders every time)
+_STORAGE_CACHE: Dict[Path, "ObjectStorage"] = {}
+
+# time.monotonic() before which check_and_run_garbage_collect skips its checks
+_NEXT_GC_CHECK: float = 0.0
+# Upper bound for that skip, so preference changes are picked up quickly
+_GC_CHECK_INTERVAL = 60.0
+
 
 def get_addon_preferences(context):
     """Get addon preferences with fallback to default values."""
+    global _ADDON_ID
     try:
-        # Get addon ID from the preferences module
-        from .. import preferences
-        addon_id = preferences.DifferenceMachinePreferences.bl_idname
-        addon = context.preferences.addons.get(addon_id)
+        if _ADDON_ID is None:
+            # Get addon ID from the preferences module
+            from .. import preferences
+            _ADDON_ID = preferences.DifferenceMachinePreferences.bl_idname
+        addon = context.preferences.addons.get(_ADDON_ID)
         if addon and hasattr(addon, 'preferences'):
             return addon.preferences
     except (KeyError, AttributeError, ImportError):
         pass
     
-    # Fallback: return a simple object with default values
-    class DefaultPreferences:
-        default_author = "Unknown"
-        auto_compress_keep_last_n = 5
-        auto_garbage_collect = False
-        gc_interval_value = 1
-        gc_interval_unit = 'DAYS'
-        gc_last_run = 0.0
+    # Fallback: shared object with default values (not cached, the addon may register later)
+    return _DEFAULT_PREFS
+
+
+def _dir_size(path) -> int:
+    """
+    Total size in bytes of regular files under path, using os.scandir.
+    
+    DirEntry caches the file type from readdir, so only files are stat'ed.
+    """
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total += _dir_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total
+
+
+def _janitor_loop() -> None:
+    """Delete directories queued by remove_tree_async(), forever (daemon thread)."""
+    while True:
+        path = _DELETE_QUEUE.get()
+        shutil.rmtree(path, ignore_errors=True)
+        with _QUEUED_DELETES_LOCK:
+            _QUEUED_DELETES.discard(path)
+        logger.debug(f"Removed temp directory in background: {path}")
+
+
+def remove_tree_async(path) -> None:
+    """
+    Delete a directory tree without blocking the caller.
+    
+    The directory is first renamed to a ".deleting-<uuid>" sibling (near-instant on the
+    same filesystem), so its path is free immediately and nobody sees a half-deleted
+    tree there; the renamed copy is removed by a daemon thread. If the rename fails
+    (e.g. a file inside is locked), the tree is removed synchronously as before.
     
-    return DefaultPreferences()
+    Args:
+        path: Directory to delete
+        
+    Raises:
+        OSError: If the synchronous fallback fails
+    """
+    path = str(path)
+    target = os.path.join(os.path.dirname(path), f"{_DELETING_PREFIX}{uuid.uuid4().hex}")
+    try:
+        os.rename(path, target)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    _queue_delete(target)
+
+
+def _queue_delete(path: str) -> None:
+    """Hand a directory to the janitor thread, starting it on first use; already queued paths are skipped."""
+    global _JANITOR_THREAD
+    path = os.path.normpath(path)
+    with _QUEUED_DELETES_LOCK:
+        if path in _QUEUED_DELETES:
+            return
+        _QUEUED_DELETES.add(path)
+    if _JANITOR_THREAD is None or not _JANITOR_THREAD.is_alive():
+        _JANITOR_THREAD = threading.Thread(target=_janitor_loop, name="df-temp-janitor", daemon=True)
+        _JANITOR_THREAD.start()
+    _DELETE_QUEUE.put(path)
 
 
 def cleanup_old_preview_temp(repo_path: Path, keep_current: Optional[str] = None) -> None:
@@ -46,52 +172,7 @@ def cleanup_old_preview_temp(repo_path: Path, keep_current: Optional[str] = None
         repo_path: Path to repository root
         keep_current: Optional path to current preview directory to keep (as string)
     """
-    import shutil
-    
-    dfm_dir = repo_path / ".DFM"
-    if not dfm_dir.exists():
-        return
-    
-    temp_dir = dfm_dir / "preview_temp"
-    if not temp_dir.exists():
-        return
-    
-    try:
-        # Get current directory path as Path if provided
-        keep_path = None
-        if keep_current:
-            keep_path = Path(keep_current)
-            if not keep_path.exists():
-                keep_path = None  # If path doesn't exist, don't try to keep it
-        
-        # Find all commit directories in preview_temp
-        removed_count = 0
-        total_size = 0
-        
-        for item in temp_dir.iterdir():
-            if not item.is_dir():
-                continue
-            
-            # Skip if this is the current preview directory
-            if keep_path and item.resolve() == keep_path.resolve():
-                continue
-            
-            # Remove old preview directory
-            try:
-                # Calculate size before removal
-                size = sum(f.stat().st_size for f in item.rglob('*') if f.is_file())
-                shutil.rmtree(item)
-                removed_count += 1
-                total_size += size
-                logger.debug(f"Removed old preview_temp directory: {item.name} ({size / (1024*1024):.1f} MB)")
-            except Exception as e:
-                logger.warning(f"Failed to remove preview_temp directory {item.name}: {e}")
-        
-        if removed_count > 0:
-            logger.info(f"Cleaned up {removed_count} old preview_temp directories ({total_size / (1024*1024):.1f} MB freed)")
-    
-    except Exception as e:
-        logger.warning(f"Failed to clean up preview_temp directories: {e}", exc_info=True)
+    _cleanup_old_temp(repo_path, "preview_temp", keep_current)
 
 
 def cleanup_old_compare_temp(repo_path: Path, keep_current: Optional[str] = None) -> None:
@@ -104,51 +185,84 @@ def cleanup_old_compare_temp(repo_path: Path, keep_current: Optional[str] = None
         repo_path: Path to repository root
         keep_current: Optional path to current compare directory to keep (as string)
     """
-    import shutil
+    _cleanup_old_temp(repo_path, "compare_temp", keep_current)
+
 
-    dfm_dir = repo_path / ".DFM"
+def _cleanup_old_temp(repo_path: Path, temp_name: str, keep_current: Optional[str] = None) -> None:
+    """
+    Remove commit directories under .DFM/<temp_name>, except keep_current.
+    
+    Args:
+        repo_path: Path to repository root
+        temp_name: Temp folder name inside .DFM ("preview_temp" or "compare_temp")
+        keep_current: Optional path to directory to keep (as string)
+    """
+    dfm_dir = _dfm_paths(repo_path)[0]
     if not dfm_dir.exists():
         return
-
-    temp_dir = dfm_dir / "compare_temp"
+    
+    temp_dir = dfm_dir / temp_name
     if not temp_dir.exists():
         return
-
+    
     try:
-        keep_path = None
-        if keep_current:
-            keep_path = Path(keep_current)
-            if not keep_path.exists():
-                keep_path = None
-
+        # Normalized path of the directory to keep, if provided
+        keep_norm = None
+        keep_needs_samefile = False
+        if keep_current and os.path.exists(keep_current):  # If path doesn't exist, don't try to keep it
+            keep_norm = os.path.normpath(os.path.abspath(keep_current))
+            # A plain string match is enough unless keep_current reaches the temp folder
+            # through another path or a symlink
+            keep_needs_samefile = (
+                os.path.dirname(keep_norm) != os.path.normpath(os.path.abspath(temp_dir))
+                or os.path.islink(keep_norm)
+            )
+        
+        # Find all commit directories in the temp folder
         removed_count = 0
         total_size = 0
-
-        for item in temp_dir.iterdir():
-            if not item.is_dir():
-                continue
-
-            if keep_path and item.resolve() == keep_path.resolve():
+        # Sizes are only reported in logs
+        measure_size = logger.isEnabledFor(logging.INFO)
+        
+        with os.scandir(temp_dir) as it:
+            # DirEntry.is_dir() uses the file type returned by readdir, no extra stat
+            entries = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+        
+        for entry in entries:
+            # Skip if this is the current directory
+            if keep_norm is not None:
+                if os.path.normpath(os.path.abspath(entry.path)) == keep_norm:
+                    continue
+                if keep_needs_samefile:
+                    # Compares st_dev/st_ino, no realpath walk
+                    try:
+                        if os.path.samefile(entry.path, keep_norm):
+                            continue
+                    except OSError:
+                        pass
+            
+            # Already renamed aside (possibly by an earlier session): hand it to the janitor
+            # unless it is queued already, without walking the tree for its size
+            if entry.name.startswith(_DELETING_PREFIX):
+                _queue_delete(entry.path)
                 continue
-
+            
+            # Remove old directory
             try:
-                size = sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
-                shutil.rmtree(item)
+                # Calculate size before removal
+                size = _dir_size(entry.path) if measure_size else 0
+                remove_tree_async(entry.path)
                 removed_count += 1
                 total_size += size
-                logger.debug(
-                    f"Removed old compare_temp directory: {item.name} ({size / (1024 * 1024):.1f} MB)"
-                )
+                logger.debug(f"Removed old {temp_name} directory: {entry.name} ({size / (1024*1024):.1f} MB)")
             except Exception as e:
-                logger.warning(f"Failed to remove compare_temp directory {item.name}: {e}")
-
+                logger.warning(f"Failed to remove {temp_name} directory {entry.name}: {e}")
+        
         if removed_count > 0:
-            logger.info(
-                f"Cleaned up {removed_count} old compare_temp directories "
-                f"({total_size / (1024 * 1024):.1f} MB freed)"
-            )
+            logger.info(f"Cleaned up {removed_count} old {temp_name} directories ({total_size / (1024*1024):.1f} MB freed)")
+    
     except Exception as e:
-        logger.warning("Failed to clean up compare_temp directories: %s", e, exc_info=True)
+        logger.warning(f"Failed to clean up {temp_name} directories: {e}", exc_info=True)
 
 
 def copy_project_textures_for_compare(source_root: Path, compare_root: Path) -> None:
@@ -213,10 +327,16 @@ def check_and_run_garbage_collect(context, repo_path: Path) -> None:
         context: Blender context
         repo_path: Path to repository root
     """
+    global _NEXT_GC_CHECK
+    now = time.monotonic()
+    if now < _NEXT_GC_CHECK:
+        return
+    
     try:
         prefs = get_addon_preferences(context)
         
         if not prefs.auto_garbage_collect:
+            _NEXT_GC_CHECK = now + _GC_CHECK_INTERVAL
             return
         
         # Calculate interval in seconds
@@ -227,30 +347,243 @@ def check_and_run_garbage_collect(context, repo_path: Path) -> None:
             interval_seconds *= 86400
         elif prefs.gc_interval_unit == 'WEEKS':
             interval_seconds *= 604800
+        _NEXT_GC_CHECK = now + min(interval_seconds, _GC_CHECK_INTERVAL)
         
         # Check if enough time has passed
         current_time = time.time()
         last_run = prefs.gc_last_run
         
         if last_run == 0.0 or (current_time - last_run) >= interval_seconds:
-            # Run garbage collection
-            from ..forester.commands.garbage_collect import garbage_collect
-            
-            logger.info("Running automatic garbage collection...")
-            success, error, stats = garbage_collect(repo_path, dry_run=False)
-            
-            if success:
-                # Update last run time
-                prefs.gc_last_run = current_time
-                logger.info(f"Garbage collection completed: {stats['commits_deleted']} commits, "
-                          f"{stats['trees_deleted']} trees, {stats['blobs_deleted']} blobs, "
-                          f"{stats['meshes_deleted']} meshes deleted")
-            else:
-                logger.warning(f"Garbage collection failed: {error}")
+            # Run garbage collection from a modal operator once the calling operator has
+            # returned, so the commit finishes and the UI redraws first
+            try:
+                bpy.ops.df.auto_garbage_collect('INVOKE_DEFAULT', repo_path=str(repo_path))
+            except RuntimeError as e:
+                # No window to attach a modal handler to (e.g. background mode)
+                logger.debug(f"Running garbage collection synchronously: {e}")
+                run_auto_garbage_collect(context, repo_path)
     except Exception as e:
         logger.error(f"Error in automatic garbage collection: {e}", exc_info=True)
 
 
+def run_auto_garbage_collect(context, repo_path: Path) -> None:
+    """
+    Run automatic garbage collection and record the run time in the preferences.
+    
+    Args:
+        context: Blender context
+        repo_path: Path to repository root
+    """
+    try:
+        from ..forester.commands.garbage_collect import garbage_collect
+        
+        prefs = get_addon_preferences(context)
+        current_time = time.time()
+        
+        logger.info("Running automatic garbage collection...")
+        success, error, stats = garbage_collect(repo_path, dry_run=False)
+        
+        if success:
+            # Update last run time
+            prefs.gc_last_run = current_time
+            logger.info(f"Garbage collection completed: {stats['commits_deleted']} commits, "
+                      f"{stats['trees_deleted']} trees, {stats['blobs_deleted']} blobs, "
+                      f"{stats['meshes_deleted']} meshes deleted")
+        else:
+            logger.warning(f"Garbage collection failed: {error}")
+    except Exception as e:
+        logger.error(f"Error in automatic garbage collection: {e}", exc_info=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _dfm_paths(root: Path) -> Tuple[Path, Path]:
+    """Return (root/.DFM, root/.DFM/forester.db), built once per root."""
+    dfm_dir = root / _DFM_DIRNAME
+    return dfm_dir, dfm_dir / _DB_FILENAME
+
+
+def _dfm_mtime(root: Path) -> Optional[int]:
+    """Return st_mtime_ns of root/.DFM, or None if it does not exist."""
+    try:
+        return os.stat(_dfm_paths(root)[0]).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _project_root_cached(filepath: str) -> Path:
+    """Return the directory of a blend file path, reusing the Path object between calls."""
+    return Path(filepath).parent
+
+
+def _find_repository_cached(project_root: Path) -> Optional[Path]:
+    """
+    find_repository() memoized per blend file directory.
+    
+    A cached entry is reused while the mtime of the .DFM folder it was checked against
+    is unchanged (the repository's .DFM when found, the project root's otherwise), so both
+    found and missing repositories are cached without missing a later init.
+    
+    Args:
+        project_root: Directory of the blend file
+        
+    Returns:
+        Path to repository root, or None if not found
+    """
+    key = str(project_root)
+    cached = _REPO_CACHE.get(key)
+    if cached is not None:
+        repo_path, mtime = cached
+        if _dfm_mtime(repo_path or project_root) == mtime:
+            return repo_path
+    
+    repo_path = find_repository(project_root)
+    _REPO_CACHE[key] = (repo_path, _dfm_mtime(repo_path or project_root))
+    return repo_path
+
+
+@dataclass(frozen=True)
+class RepoState:
+    """Repository state for a blend file, gathered in one pass."""
+    repo_path: Optional[Path]
+    dfm_exists: bool
+    db_exists: bool
+    branches: Tuple[str, ...]
+
+
+def _list_branches_cached(repo_path: Path) -> Tuple[str, ...]:
+    """
+    Return the sorted branch names of a repository, memoized while the refs directory is unchanged.
+    
+    Creating or deleting a branch changes the mtime of .DFM/refs/branches. Only the
+    ref files are listed (no database query), which is all the existence checks need.
+    """
+    branches_dir = _dfm_paths(repo_path)[0] / "refs" / "branches"
+    try:
+        mtime = os.stat(branches_dir).st_mtime_ns
+    except OSError:
+        _BRANCHES_CACHE.pop(repo_path, None)
+        return ()
+    
+    cached = _BRANCHES_CACHE.get(repo_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    branches: Tuple[str, ...] = ()
+    try:
+        with os.scandir(branches_dir) as it:
+            branches = tuple(sorted(entry.name for entry in it if entry.is_file()))
+    except OSError:
+        pass
+    _BRANCHES_CACHE[repo_path] = (mtime, branches)
+    return branches
+
+
+def _scan_repo_state(filepath: str) -> RepoState:
+    """
+    Scan repository state for a blend file path.
+    
+    Does one (cached) find_repository, one os.scandir of .DFM and one
+    _list_branches_cached. The result is reused while the .DFM mtime and the
+    branch names are unchanged.
+    
+    Args:
+        filepath: Blend file path (bpy.data.filepath)
+        
+    Returns:
+        RepoState for the repository (or the blend file directory when none is found)
+    """
+    project_root = _project_root_cached(filepath)
+    repo_path = _find_repository_cached(project_root)
+    # _find_repository_cached has just validated the .DFM mtime
+    dfm_mtime = _REPO_CACHE[str(project_root)][1]
+    branches = _list_branches_cached(repo_path or project_root)
+    
+    key = (dfm_mtime, branches)
+    cached = _REPO_STATE_CACHE.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    dfm_exists = False
+    db_exists = False
+    try:
+        with os.scandir(_dfm_paths(repo_path or project_root)[0]) as it:
+            dfm_exists = True
+            db_exists = any(entry.name == _DB_FILENAME and entry.is_file() for entry in it)
+    except OSError:
+        pass
+    
+    state = RepoState(repo_path, dfm_exists, db_exists, branches)
+    _REPO_STATE_CACHE[filepath] = (key, state)
+    return state
+
+
+def _get_storage(repo_path: Path):
+    """Return the ObjectStorage for repo_path, creating it once per repository."""
+    storage = _STORAGE_CACHE.get(repo_path)
+    if storage is None:
+        from ..forester.core.storage import ObjectStorage
+        storage = ObjectStorage(_dfm_paths(repo_path)[0])
+        _STORAGE_CACHE[repo_path] = storage
+    return storage
+
+
+def get_cached_repository(filepath: str) -> Optional[Tuple[Path, "ObjectStorage"]]:
+    """
+    Return (repo_path, storage) for a blend file, reusing cached lookups.
+    
+    The repository lookup and object storage are kept until clear_repository_caches()
+    runs (blend file load/save, repository init). Callers open the database themselves,
+    for the duration of one operation.
+    
+    Args:
+        filepath: Blend file path (bpy.data.filepath)
+        
+    Returns:
+        Tuple of (repo_path, storage), or None if the file is unsaved or not in a repository
+    """
+    if not filepath:
+        return None
+    repo_path = _find_repository_cached(_project_root_cached(filepath))
+    if not repo_path:
+        return None
+    return repo_path, _get_storage(repo_path)
+
+
+def clear_repository_caches() -> None:
+    """Drop cached repository lookups (e.g. after a blend file load/save or repository init)."""
+    _REPO_CACHE.clear()
+    _BRANCHES_CACHE.clear()
+    _REPO_STATE_CACHE.clear()
+    _STORAGE_CACHE.clear()
+    _INITIALIZED_CACHE.clear()
+    _project_root_cached.cache_clear()
+    # The preferences panel keeps its own short-lived copy of the repository check
+    from .. import preferences
+    preferences.clear_repo_check()
+
+
+@bpy.app.handlers.persistent
+def _on_blend_file_change(*args) -> None:
+    """load_post/save_post handler: the blend file location may have changed."""
+    clear_repository_caches()
+
+
+def register_handlers() -> None:
+    """Register blend file load/save handlers that invalidate repository caches."""
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.save_post):
+        if _on_blend_file_change not in handlers:
+            handlers.append(_on_blend_file_change)
+
+
+def unregister_handlers() -> None:
+    """Remove handlers added by register_handlers()."""
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.save_post):
+        if _on_blend_file_change in handlers:
+            handlers.remove(_on_blend_file_change)
+    clear_repository_caches()
+
+
 def get_repository_path(operator=None) -> Tuple[Optional[Path], Optional[str]]:
     """
     Get repository path from current Blender file.
@@ -269,8 +602,7 @@ def get_repository_path(operator=None) -> Tuple[Optional[Path], Optional[str]]:
             operator.report({'ERROR'}, error_msg)
         return None, error_msg
     
-    blend_file = Path(bpy.data.filepath)
-    repo_path = find_repository(blend_file.parent)
+    repo_path = _find_repository_cached(_project_root_cached(bpy.data.filepath))
     if not repo_path:
         error_msg = "Not a Forester repository"
         if operator:
@@ -293,12 +625,27 @@ def is_repository_initialized(context) -> bool:
     if not bpy.data.filepath:
         return False
     
-    blend_file = Path(bpy.data.filepath)
-    project_root = blend_file.parent
-    dfm_dir = project_root / ".DFM"
-    db_path = dfm_dir / "forester.db"
+    return _is_initialized_cached(bpy.data.filepath)
+
+
+def _is_initialized_cached(filepath: str) -> bool:
+    """
+    is_repository_initialized() result per blend file path.
+    
+    Called on every panel redraw. A cached result is reused while the .DFM mtime is
+    unchanged: creating .DFM or forester.db inside it changes that mtime, so a cached
+    False does not outlive a repository init done outside this add-on.
+    """
+    project_root = _project_root_cached(filepath)
+    mtime = _dfm_mtime(project_root)
+    cached = _INITIALIZED_CACHE.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     
-    return dfm_dir.exists() and db_path.exists()
+    # forester.db can only exist inside .DFM: no .DFM, no second stat
+    initialized = mtime is not None and os.path.exists(_dfm_paths(project_root)[1])
+    _INITIALIZED_CACHE[filepath] = (mtime, initialized)
+    return initialized
 
 
 def check_repository_state(context) -> Tuple[bool, bool, bool, Optional[str]]:
@@ -315,25 +662,18 @@ def check_repository_state(context) -> Tuple[bool, bool, bool, Optional[str]]:
     if not bpy.data.filepath:
         return (False, False, False, "Please save the Blender file first")
     
-    blend_file = Path(bpy.data.filepath)
+    state = _scan_repo_state(bpy.data.filepath)
     
     # Check if repository exists
-    project_root = blend_file.parent
-    repo_path = find_repository(project_root)
-    if not repo_path:
+    if not state.repo_path:
         # Check if .DFM directory exists
-        dfm_dir = project_root / ".DFM"
-        if not dfm_dir.exists():
+        if not state.dfm_exists:
             return (True, False, False, "Repository not initialized. Please create a project folder and save the Blender file in it.")
         return (True, False, False, "Repository not found")
     
     # Check if branches exist
-    try:
-        branches = list_branches(repo_path)
-        has_branches = len(branches) > 0
-        return (True, True, has_branches, None if has_branches else "No branches found. Please create a branch first.")
-    except Exception as e:
-        return (True, True, False, f"Error checking branches: {str(e)}")
+    has_branches = len(state.branches) > 0
+    return (True, True, has_branches, None if has_branches else "No branches found. Please create a branch first.")
 
 
 def get_active_mesh_object(operator=None) -> Tuple[Optional[bpy.types.Object], Optional[str]]:
@@ -371,18 +711,19 @@ def process_meshes_sequentially(selected_objects, process_func, *args, **kwargs)
     Returns:
         List of results for successfully processed meshes
     """
-    results = []
+    # Preallocated: the number of objects is known up front
+    results = [None] * len(selected_objects)
+    count = 0
     for obj in selected_objects:
         try:
             success, result = process_func(obj, *args, **kwargs)
             if success:
-                results.append(result)
+                results[count] = result
+                count += 1
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to process {obj.name}: {e}")
             continue
-    return results
+    return results[:count]
 
 
 def ensure_repository_and_branch(context, operator) -> Tuple[Optional[Path], Optional[str]]:
@@ -404,15 +745,15 @@ def ensure_repository_and_branch(context, operator) -> Tuple[Optional[Path], Opt
         operator.report({'ERROR'}, error_msg)
         return None, error_msg
     
-    blend_file = Path(bpy.data.filepath)
-    project_root = blend_file.parent
+    project_root = _project_root_cached(bpy.data.filepath)
     
     # Check if repository exists
-    repo_path = find_repository(project_root)
+    repo_path = _find_repository_cached(project_root)
     if not repo_path:
         # Initialize repository
         try:
             init_repository(project_root)
+            clear_repository_caches()
             repo_path = project_root
             operator.report({'INFO'}, "Repository initialized")
         except (ValueError, OSError, PermissionError) as e:
@@ -428,8 +769,7 @@ def ensure_repository_and_branch(context, operator) -> Tuple[Optional[Path], Opt
     
     # Check if branches exist
     try:
-        from ..forester.commands import list_branches
-        branches = list_branches(repo_path)
+        branches = _scan_repo_state(bpy.data.filepath).branches
         if len(branches) == 0:
             error_msg = (
                 "No branches found. Please create a branch first.\n"
@@ -453,7 +793,7 @@ def ensure_repository_and_branch(context, operator) -> Tuple[Optional[Path], Opt
             from ..forester.commands import create_branch
             create_branch(repo_path, branch_name)
             # Update current branch in database
-            db_path = repo_path / ".DFM" / "forester.db"
+            db_path = _dfm_paths(repo_path)[1]
             if db_path.exists():
                 with ForesterDB(db_path) as db:
                     db.set_current_branch(branch_name)
@@ -465,42 +805,3 @@ def ensure_repository_and_branch(context, operator) -> Tuple[Optional[Path], Opt
             logger.warning(f"Failed to create branch '{branch_name}': {e}")
     
     return repo_path, None
-
-
-def validate_branch_name(name: str) -> Tuple[bool, Optional[str]]:
-    """
-    Validate branch name according to git-like rules.
-    
-    Args:
-        name: Branch name to validate
-        
-    Returns:
-        Tuple of (is_valid, error_message)
-        If valid: (True, None)
-        If invalid: (False, error_message)
-    """
-    if not name:
-        return False, "Branch name cannot be empty"
-    
-    if len(name) > 255:
-        return False, "Branch name too long (max 255 characters)"
-    
-    # Check for forbidden patterns
-    forbidden_patterns = ['..', '~', '^', ':', '?', '*', '[', '\\']
-    for pattern in forbidden_patterns:
-        if pattern in name:
-            return False, f"Branch name cannot contain '{pattern}'"
-    
-    # Check for leading/trailing dots or spaces
-    if name.startswith('.') or name.endswith('.'):
-        return False, "Branch name cannot start or end with '.'"
-    
-    if name.startswith(' ') or name.endswith(' '):
-        return False, "Branch name cannot start or end with space"
-    
-    # Check for control characters
-    if any(ord(c) < 32 for c in name):
-        return False, "Branch name cannot contain control characters"
-    
-    return True, None
-
@@ -4,22 +4,196 @@ Review tools operators for Difference Machine add-on.
 
 import bpy
 import logging
+import time
 from bpy.props import StringProperty, FloatProperty, IntProperty
 from bpy.types import Operator
 from pathlib import Path
-from ..operators.operator_helpers import get_repository_path
+from typing import Optional
+from ..operators.operator_helpers import get_repository_path, get_addon_preferences
 from ..forester.commands.review import (
     add_comment,
     get_comments,
     resolve_comment,
     delete_comment,
     set_approval,
-    get_approval,
     get_all_approvals,
 )
 
 logger = logging.getLogger(__name__)
 
+# Author name of the last lookup; reset by the default_author update callback
+_AUTHOR_CACHE: Optional[str] = None
+
+
+def _author(context) -> str:
+    """Return the author name for comments and approvals from the addon preferences."""
+    global _AUTHOR_CACHE
+    if _AUTHOR_CACHE is None:
+        prefs = get_addon_preferences(context)
+        _AUTHOR_CACHE = prefs.default_author or "Unknown"
+    return _AUTHOR_CACHE
+
+
+def clear_author_cache() -> None:
+    """Forget the cached author name (called when the default_author preference changes)."""
+    global _AUTHOR_CACHE
+    _AUTHOR_CACHE = None
+
+
+def _refresh_comments(context, repo_path: Path, asset_hash: str, asset_type: str) -> bool:
+    """
+    Reload unresolved comments for an asset into context.scene.df_comments.
+
+    Called directly by the comment operators instead of going through bpy.ops.
+
+    Returns:
+        True on success, False if loading failed (the error is logged)
+    """
+    try:
+        comments = get_comments(repo_path, asset_hash, asset_type, include_resolved=False)
+        
+        comments_list = context.scene.df_comments
+        
+        # Ids read once, shared by the fingerprint and foreach_set below
+        ids = [comment['id'] for comment in comments]
+        
+        # Skip the rebuild (and the UI list invalidation) if nothing changed since the last refresh
+        fingerprint = str(hash(tuple(ids)))
+        if (context.scene.get('_df_comments_fp') == fingerprint
+                and len(comments_list) == len(comments)
+                and context.scene.df_review_asset_hash == asset_hash
+                and context.scene.df_review_asset_type == asset_type):
+            return True
+        
+        comments_list.clear()
+        
+        for _ in range(len(comments)):
+            comments_list.add()
+        
+        # Numeric columns in one foreach_set each; only strings need per-item writes
+        if comments:
+            comments_list.foreach_set("comment_id", ids)
+            comments_list.foreach_set("created_at", [comment['created_at'] for comment in comments])
+            comments_list.foreach_set("x", [comment.get('x') or 0.0 for comment in comments])
+            comments_list.foreach_set("y", [comment.get('y') or 0.0 for comment in comments])
+            # Only unresolved comments are loaded, and new items already default to resolved=False
+        
+        for item, comment in zip(comments_list, comments):
+            item.asset_hash = comment['asset_hash']
+            item.asset_type = comment['asset_type']
+            item.author = comment['author']
+            item.text = comment['text']
+        
+        # Store asset info for refresh operations
+        context.scene.df_review_asset_hash = asset_hash
+        context.scene.df_review_asset_type = asset_type
+        context.scene['_df_comments_fp'] = fingerprint
+        
+        return True
+    except Exception as e:
+        logger.error(f"Failed to refresh comments: {e}", exc_info=True)
+        return False
+
+
+def _refresh_approvals(context, repo_path: Path, asset_hash: str, asset_type: str) -> bool:
+    """
+    Reload approvals for an asset into context.scene.df_approvals.
+
+    Returns:
+        True on success, False if loading failed (the error is logged)
+    """
+    try:
+        approvals = get_all_approvals(repo_path, asset_hash, asset_type)
+        
+        approvals_list = context.scene.df_approvals
+        
+        fingerprint = str(hash(tuple(
+            (approval['asset_hash'], approval['status'], approval['approver'],
+             approval['created_at'], approval.get('comment'))
+            for approval in approvals
+        )))
+        if context.scene.get('_df_approvals_fp') == fingerprint and len(approvals_list) == len(approvals):
+            return True
+        
+        # Rebuild only when the row count changed; otherwise overwrite fields that differ,
+        # which avoids RNA string writes for rows that are unchanged
+        if len(approvals_list) != len(approvals):
+            approvals_list.clear()
+            for _ in range(len(approvals)):
+                approvals_list.add()
+        
+        if approvals:
+            approvals_list.foreach_set("created_at", [approval['created_at'] for approval in approvals])
+        
+        for item, approval in zip(approvals_list, approvals):
+            for field, value in (
+                ('asset_hash', approval['asset_hash']),
+                ('asset_type', approval['asset_type']),
+                ('status', approval['status']),
+                ('approver', approval['approver']),
+                ('comment', approval.get('comment', '') or ''),
+            ):
+                if getattr(item, field) != value:
+                    setattr(item, field, value)
+        
+        context.scene['_df_approvals_fp'] = fingerprint
+        return True
+    except Exception as e:
+        logger.error(f"Failed to refresh approvals: {e}", exc_info=True)
+        return False
+
+
+def _remove_comment_item(context, comment_id: int) -> bool:
+    """
+    Remove one comment from context.scene.df_comments in place.
+
+    The list only shows unresolved comments, so this matches what a full refresh
+    would produce after a resolve or delete.
+
+    Returns:
+        True if the comment was found and removed
+    """
+    comments_list = context.scene.df_comments
+    for index, item in enumerate(comments_list):
+        if item.comment_id == comment_id:
+            comments_list.remove(index)
+            return True
+    return False
+
+
+def _upsert_approval_item(context, asset_hash: str, asset_type: str, approver: str,
+                          status: str, comment: str) -> bool:
+    """
+    Apply one set_approval() result to context.scene.df_approvals in place.
+
+    The backend keeps one approval per (asset, approver) and lists them newest first,
+    so the row is updated (or added) and moved to the top.
+
+    Returns:
+        True if the list was updated, False if it does not currently show this asset
+    """
+    approvals_list = context.scene.df_approvals
+    if not approvals_list or any(
+        item.asset_hash != asset_hash or item.asset_type != asset_type for item in approvals_list
+    ):
+        return False
+    
+    index = next((i for i, item in enumerate(approvals_list) if item.approver == approver), None)
+    if index is None:
+        item = approvals_list.add()
+        item.asset_hash = asset_hash
+        item.asset_type = asset_type
+        item.approver = approver
+        index = len(approvals_list) - 1
+    else:
+        item = approvals_list[index]
+    item.status = status
+    item.comment = comment
+    item.created_at = int(time.time())
+    if index != 0:
+        approvals_list.move(index, 0)
+    return True
+
 
 class DF_OT_add_comment(Operator):
     """Add comment to commit/mesh/blob."""
@@ -49,9 +223,7 @@ class DF_OT_add_comment(Operator):
             return {'CANCELLED'}
 
         # Get author from addon preferences or use default
-        from ..operators.operator_helpers import get_addon_preferences
-        prefs = get_addon_preferences(context)
-        author = prefs.author_name if hasattr(prefs, 'author_name') else "Unknown"
+        author = _author(context)
 
         try:
             comment_id = add_comment(
@@ -66,7 +238,7 @@ class DF_OT_add_comment(Operator):
             self.report({'INFO'}, f"Comment added (ID: {comment_id})")
             
             # Refresh comments in UI
-            bpy.ops.df.refresh_comments(asset_hash=self.asset_hash, asset_type=self.asset_type)
+            _refresh_comments(context, repo_path, self.asset_hash, self.asset_type)
             
             return {'FINISHED'}
         except Exception as e:
@@ -93,11 +265,16 @@ class DF_OT_resolve_comment(Operator):
         try:
             if resolve_comment(repo_path, self.comment_id):
                 self.report({'INFO'}, "Comment resolved")
-                # Refresh comments
-                asset_hash = getattr(context.scene, 'df_review_asset_hash', '')
-                asset_type = getattr(context.scene, 'df_review_asset_type', '')
-                if asset_hash and asset_type:
-                    bpy.ops.df.refresh_comments(asset_hash=asset_hash, asset_type=asset_type)
+                # Update the list in place; fall back to a full refresh if the item is not there
+                if not _remove_comment_item(context, self.comment_id):
+                    scene = context.scene
+                    try:
+                        asset_hash = scene.df_review_asset_hash
+                        asset_type = scene.df_review_asset_type
+                    except AttributeError:
+                        asset_hash = asset_type = ''
+                    if asset_hash and asset_type:
+                        _refresh_comments(context, repo_path, asset_hash, asset_type)
                 return {'FINISHED'}
             else:
                 self.report({'ERROR'}, "Failed to resolve comment")
@@ -130,11 +307,16 @@ class DF_OT_delete_comment(Operator):
         try:
             if delete_comment(repo_path, self.comment_id):
                 self.report({'INFO'}, "Comment deleted")
-                # Refresh comments
-                asset_hash = getattr(context.scene, 'df_review_asset_hash', '')
-                asset_type = getattr(context.scene, 'df_review_asset_type', '')
-                if asset_hash and asset_type:
-                    bpy.ops.df.refresh_comments(asset_hash=asset_hash, asset_type=asset_type)
+                # Update the list in place; fall back to a full refresh if the item is not there
+                if not _remove_comment_item(context, self.comment_id):
+                    scene = context.scene
+                    try:
+                        asset_hash = scene.df_review_asset_hash
+                        asset_type = scene.df_review_asset_type
+                    except AttributeError:
+                        asset_hash = asset_type = ''
+                    if asset_hash and asset_type:
+                        _refresh_comments(context, repo_path, asset_hash, asset_type)
                 return {'FINISHED'}
             else:
                 self.report({'ERROR'}, "Failed to delete comment")
@@ -164,9 +346,7 @@ class DF_OT_set_approval(Operator):
             return {'CANCELLED'}
 
         # Get approver from addon preferences
-        from ..operators.operator_helpers import get_addon_preferences
-        prefs = get_addon_preferences(context)
-        approver = prefs.author_name if hasattr(prefs, 'author_name') else "Unknown"
+        approver = _author(context)
 
         try:
             set_approval(
@@ -180,8 +360,10 @@ class DF_OT_set_approval(Operator):
             status_text = "approved" if self.status == "approved" else "rejected" if self.status == "rejected" else "pending"
             self.report({'INFO'}, f"Asset {status_text}")
             
-            # Refresh approvals in UI
-            bpy.ops.df.refresh_approvals(asset_hash=self.asset_hash, asset_type=self.asset_type)
+            # Update approvals in UI; reload only if the list shows another asset
+            if not _upsert_approval_item(context, self.asset_hash, self.asset_type, approver,
+                                         self.status, self.comment.strip() if self.comment else ''):
+                _refresh_approvals(context, repo_path, self.asset_hash, self.asset_type)
             
             return {'FINISHED'}
         except Exception as e:
@@ -206,37 +388,9 @@ class DF_OT_refresh_comments(Operator):
         if not repo_path:
             return {'CANCELLED'}
 
-        try:
-            comments = get_comments(repo_path, self.asset_hash, self.asset_type, include_resolved=False)
-            
-            # Store comments in scene property
-            if not hasattr(context.scene, 'df_comments'):
-                from ..properties.review_properties import register_review_properties
-                register_review_properties()
-            
-            comments_list = context.scene.df_comments
-            comments_list.clear()
-            
-            for comment in comments:
-                item = comments_list.add()
-                item.comment_id = comment['id']
-                item.asset_hash = comment['asset_hash']
-                item.asset_type = comment['asset_type']
-                item.author = comment['author']
-                item.text = comment['text']
-                item.created_at = comment['created_at']
-                item.x = comment.get('x', 0.0) if comment.get('x') is not None else 0.0
-                item.y = comment.get('y', 0.0) if comment.get('y') is not None else 0.0
-                item.resolved = comment.get('resolved', 0) == 1
-            
-            # Store asset info for refresh operations
-            context.scene.df_review_asset_hash = self.asset_hash
-            context.scene.df_review_asset_type = self.asset_type
-            
-            return {'FINISHED'}
-        except Exception as e:
-            logger.error(f"Failed to refresh comments: {e}", exc_info=True)
+        if not _refresh_comments(context, repo_path, self.asset_hash, self.asset_type):
             return {'CANCELLED'}
+        return {'FINISHED'}
 
 
 class DF_OT_refresh_approvals(Operator):
@@ -255,28 +409,6 @@ class DF_OT_refresh_approvals(Operator):
         if not repo_path:
             return {'CANCELLED'}
 
-        try:
-            approvals = get_all_approvals(repo_path, self.asset_hash, self.asset_type)
-            
-            # Store approvals in scene property
-            if not hasattr(context.scene, 'df_approvals'):
-                from ..properties.review_properties import register_review_properties
-                register_review_properties()
-            
-            approvals_list = context.scene.df_approvals
-            approvals_list.clear()
-            
-            for approval in approvals:
-                item = approvals_list.add()
-                item.asset_hash = approval['asset_hash']
-                item.asset_type = approval['asset_type']
-                item.status = approval['status']
-                item.approver = approval['approver']
-                item.comment = approval.get('comment', '') or ''
-                item.created_at = approval['created_at']
-            
-            return {'FINISHED'}
-        except Exception as e:
-            logger.error(f"Failed to refresh approvals: {e}", exc_info=True)
+        if not _refresh_approvals(context, repo_path, self.asset_hash, self.asset_type):
             return {'CANCELLED'}
-
+        return {'FINISHED'}
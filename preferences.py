@@ -1,10 +1,52 @@
 import bpy
 from bpy.types import AddonPreferences
 from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty
-from pathlib import Path
 import time
 
 
+# Repository check reused by draw() for a short time (Blender redraws preferences on mouse move)
+_REPO_CHECK_TTL = 2.0
+_repo_check_expiry = 0.0
+_repo_check_filepath = None
+_cached_repo_exists = False
+
+
+def _repo_exists() -> bool:
+    """Return whether the open blend file is in a repository, re-checked at most every _REPO_CHECK_TTL seconds."""
+    global _repo_check_expiry, _repo_check_filepath, _cached_repo_exists
+    filepath = bpy.data.filepath
+    now = time.monotonic()
+    if now < _repo_check_expiry and filepath == _repo_check_filepath:
+        return _cached_repo_exists
+    
+    repo_exists = False
+    # Unsaved files skip the lookup entirely
+    if filepath:
+        try:
+            from .operators.operator_helpers import get_repository_path
+            repo_path, _ = get_repository_path()
+            repo_exists = repo_path is not None
+        except Exception:
+            pass
+    
+    _cached_repo_exists = repo_exists
+    _repo_check_filepath = filepath
+    _repo_check_expiry = now + _REPO_CHECK_TTL
+    return repo_exists
+
+
+def clear_repo_check() -> None:
+    """Forget the cached repository check (called from clear_repository_caches())."""
+    global _repo_check_expiry
+    _repo_check_expiry = 0.0
+
+
+def _update_default_author(self, context):
+    """Drop the author name cached by the review operators."""
+    from .operators.review_operators import clear_author_cache
+    clear_author_cache()
+
+
 class DifferenceMachinePreferences(AddonPreferences):
     bl_idname = __package__
 
@@ -12,6 +54,7 @@ class DifferenceMachinePreferences(AddonPreferences):
         name="Default Author",
         description="Default author name for commits",
         default="Unknown",
+        update=_update_default_author,
     )
 
     auto_compress: BoolProperty(
@@ -78,15 +121,7 @@ class DifferenceMachinePreferences(AddonPreferences):
         box.label(text="Garbage Collection", icon='BRUSH_DATA')
         
         # Check if repository exists
-        blend_file = Path(bpy.data.filepath) if bpy.data.filepath else None
-        repo_exists = False
-        if blend_file:
-            try:
-                from .forester.commands.init import find_repository
-                repo_path = find_repository(blend_file.parent)
-                repo_exists = repo_path is not None
-            except Exception:
-                pass
+        repo_exists = _repo_exists()
         
         if repo_exists:
             # Manual garbage collect button
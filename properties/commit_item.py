@@ -2,8 +2,44 @@
 Property items for commit and branch lists.
 """
 
+import json
+from datetime import datetime
+from typing import List
+
 import bpy
-from bpy.props import StringProperty, IntProperty, BoolProperty
+from bpy.props import StringProperty, IntProperty, BoolProperty, CollectionProperty
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters plus an ellipsis, returning short text unchanged."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def format_commit_date(timestamp: int) -> str:
+    """Format a commit timestamp for the history list ("Unknown" for unset or out-of-range timestamps)."""
+    if not timestamp:
+        return "Unknown"
+    try:
+        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+    except (OverflowError, OSError, ValueError):
+        return "Unknown"
+
+
+def parse_mesh_names(mesh_names_str: str) -> List[str]:
+    """Parse selected_mesh_names (JSON list or comma-separated string) into a list of names."""
+    try:
+        if mesh_names_str.startswith('['):
+            return json.loads(mesh_names_str)
+        # Comma-separated string
+        return [name.strip() for name in mesh_names_str.split(',') if name.strip()]
+    except ValueError:
+        return [mesh_names_str] if mesh_names_str else []
+
+
+class DFMeshNameItem(bpy.types.PropertyGroup):
+    """Property group for one mesh name of a mesh-only commit."""
+    
+    name: StringProperty(name="Name")
 
 
 class DFCommitItem(bpy.types.PropertyGroup):
@@ -15,9 +51,28 @@ class DFCommitItem(bpy.types.PropertyGroup):
     timestamp: IntProperty(name="Timestamp")
     commit_type: StringProperty(name="Type", default="project")
     selected_mesh_names: StringProperty(name="Mesh Names")  # JSON string
+    mesh_names: CollectionProperty(type=DFMeshNameItem)  # Parsed selected_mesh_names, filled on refresh
     screenshot_hash: StringProperty(name="Screenshot Hash")
     tag: StringProperty(name="Tag", default="")
     is_selected: BoolProperty(name="Selected", default=False)
+    # Display strings cached by update_display() so the UI list does no formatting per redraw
+    date_display: StringProperty(name="Date")
+    display_text: StringProperty(name="Display Text")
+    
+    def format_display_text(self, date_str: str) -> str:
+        """Build the list row text: "Message [Tag] | Author | Date Time"."""
+        # Format message (truncate if too long to fit in UI)
+        message_text = _truncate(self.message, 30)
+        
+        # Add tag to display if present
+        tag_text = f" [{self.tag}]" if self.tag else ""
+        
+        return f"{message_text}{tag_text} | {self.author} | {date_str}"
+    
+    def update_display(self) -> None:
+        """Cache the formatted date and list row text (call after filling the item)."""
+        self.date_display = format_commit_date(self.timestamp)
+        self.display_text = self.format_display_text(self.date_display)
 
 
 class DFBranchItem(bpy.types.PropertyGroup):
@@ -29,35 +84,48 @@ class DFBranchItem(bpy.types.PropertyGroup):
     last_commit_message: StringProperty(name="Last Commit Message")
     is_current: BoolProperty(name="Current", default=False)
     branch_index: IntProperty(name="Branch Index", default=-1)  # Index in database list (not displayed in UI)
+    # Display strings cached by update_display() so the UI list does no formatting per redraw
+    commit_count_text: StringProperty(name="Commit Count Text")
+    last_commit_text: StringProperty(name="Last Commit Text")
+    row_text: StringProperty(name="Row Text")
+    
+    def format_commit_count(self) -> str:
+        """Build the commit count label."""
+        # Use proper pluralization
+        return f"{self.commit_count} {'commit' if self.commit_count == 1 else 'commits'}"
+    
+    def format_last_commit(self) -> str:
+        """Build the last commit label (message truncated)."""
+        if not self.last_commit_message:
+            return "Last: —"
+        return f"Last: {_truncate(self.last_commit_message, 20)}"
+    
+    def format_row_text(self, commit_count_text: str, last_commit_text: str) -> str:
+        """Build the list row text: "Name | N commits | Last: message"."""
+        return f"{self.name} | {commit_count_text} | {last_commit_text}"
+    
+    def update_display(self) -> None:
+        """Cache the commit count, last commit and row labels (call after filling the item)."""
+        self.commit_count_text = self.format_commit_count()
+        self.last_commit_text = self.format_last_commit()
+        self.row_text = self.format_row_text(self.commit_count_text, self.last_commit_text)
+
+
+_CLASSES = (DFMeshNameItem, DFCommitItem, DFBranchItem)
 
 
 def register():
     """Register property groups."""
-    # Try to unregister first (for reload scenarios)
-    try:
-        bpy.utils.unregister_class(DFCommitItem)
-    except (RuntimeError, ValueError):
-        pass
-    
-    try:
-        bpy.utils.unregister_class(DFBranchItem)
-    except (RuntimeError, ValueError):
-        pass
-    
-    # Register classes
-    bpy.utils.register_class(DFCommitItem)
-    bpy.utils.register_class(DFBranchItem)
+    for cls in _CLASSES:
+        # Unregister a stale copy left by a reload; look it up instead of catching errors
+        registered = getattr(bpy.types, cls.__name__, None)
+        if registered is not None:
+            bpy.utils.unregister_class(registered)
+        bpy.utils.register_class(cls)
 
 
 def unregister():
     """Unregister property groups."""
-    try:
-        bpy.utils.unregister_class(DFBranchItem)
-    except (RuntimeError, ValueError):
-        pass
-    
-    try:
-        bpy.utils.unregister_class(DFCommitItem)
-    except (RuntimeError, ValueError):
-        pass
-
+    for cls in reversed(_CLASSES):
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
@@ -2,15 +2,88 @@
 Custom properties for Difference Machine add-on.
 """
 
+import functools
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
 import bpy
 from bpy.props import (
     EnumProperty,
     StringProperty,
     BoolProperty,
     IntProperty,
-    CollectionProperty,
 )
 
+from .commit_item import DFMeshNameItem, DFCommitItem, DFBranchItem
+from ..forester.core.database import ForesterDB
+from ..forester.models.commit import Commit
+from ..forester.commands.checkout import restore_files_from_tree, restore_meshes_from_commit
+from ..operators.operator_helpers import (
+    cleanup_old_preview_temp,
+    get_cached_repository,
+    get_repository_path,
+    remove_tree_async,
+)
+
+# Static EnumProperty items, built once at import
+_COMMIT_MODE_ITEMS = (
+    ('FULL_PROJECT', "Full Project", "Commit entire working directory"),
+    ('SELECTED_OBJECT', "Selected Object", "Commit only selected meshes"),
+)
+
+# Shared with the compare operator's axis option
+COMPARISON_AXIS_ITEMS = (
+    ('X', 'X', 'Offset along X axis'),
+    ('Y', 'Y', 'Offset along Y axis'),
+    ('Z', 'Z', 'Offset along Z axis'),
+)
+
+_DIFF_COLOR_ITEMS = (
+    ('displacement', 'Displacement', 'Color by vertex displacement magnitude'),
+    ('added', 'Added', 'Green for added vertices'),
+    ('removed', 'Removed', 'Red for removed vertices'),
+    ('modified', 'Modified', 'Yellow for modified vertices'),
+)
+
+# Tag filter debounce: one history refresh per typing burst instead of per keystroke
+_TAG_FILTER_DEBOUNCE = 0.3
+_LAST_TAG_EDIT = 0.0
+_TAG_REFRESH_PENDING = False
+
+# Commit preview debounce: (index, hash) of the latest selection, loaded once it stops changing
+_PREVIEW_DEBOUNCE = 0.4
+_PENDING_PREVIEW = None
+_LAST_PREVIEW_SELECT = 0.0
+_PREVIEW_LOAD_PENDING = False
+_LOADED_PREVIEW_HASH = None
+
+# .DFM folders whose preview_temp was already swept by a preview load this session
+_CLEANUP_DONE = set()
+_PREVIEW_SWEEP_INTERVAL = 60.0
+
+# Recently previewed commits: hash -> (Commit, Tree), least recently used first
+_TREE_CACHE_SIZE = 8
+_TREE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _refresh_history_after_typing():
+    """Timer callback: refresh history once no key was typed for _TAG_FILTER_DEBOUNCE seconds."""
+    global _TAG_REFRESH_PENDING
+    elapsed = time.monotonic() - _LAST_TAG_EDIT
+    if elapsed < _TAG_FILTER_DEBOUNCE:
+        return _TAG_FILTER_DEBOUNCE - elapsed  # Re-arm until typing settles
+    
+    _TAG_REFRESH_PENDING = False
+    try:
+        bpy.ops.df.refresh_history()
+    except Exception:
+        pass  # Silently fail if can't refresh
+    return None
+
 
 class DFCommitProperties(bpy.types.PropertyGroup):
     """Properties for commit operations."""
@@ -19,10 +92,7 @@ class DFCommitProperties(bpy.types.PropertyGroup):
     commit_mode: EnumProperty(
         name="Commit Mode",
         description="Type of commit to create",
-        items=[
-            ('FULL_PROJECT', "Full Project", "Commit entire working directory"),
-            ('SELECTED_OBJECT', "Selected Object", "Commit only selected meshes"),
-        ],
+        items=_COMMIT_MODE_ITEMS,
         default='FULL_PROJECT',
     )
     
@@ -86,25 +156,6 @@ class DFCommitProperties(bpy.types.PropertyGroup):
         default=True,
     )
     
-    # Legacy properties for backward compatibility
-    export_vertices: BoolProperty(
-        name="Vertices",
-        description="Export vertices",
-        default=True,
-    )
-    
-    export_faces: BoolProperty(
-        name="Faces",
-        description="Export faces",
-        default=True,
-    )
-    
-    export_normals: BoolProperty(
-        name="Normals",
-        description="Export normals",
-        default=True,
-    )
-    
     # Auto-compress
     auto_compress: BoolProperty(
         name="Auto-compress Old Versions",
@@ -142,16 +193,13 @@ class DFCommitProperties(bpy.types.PropertyGroup):
     
     def update_tag_filter(self, context):
         """Update callback for tag search filter - refreshes commit list."""
-        # Auto-refresh history when filter changes
+        # Auto-refresh history when filter changes, once typing has settled.
         # Use timer to avoid context issues during property update
-        def refresh_after_update():
-            try:
-                bpy.ops.df.refresh_history()
-            except:
-                pass  # Silently fail if can't refresh
-        
-        # Schedule refresh for next frame
-        bpy.app.timers.register(refresh_after_update, first_interval=0.1)
+        global _LAST_TAG_EDIT, _TAG_REFRESH_PENDING
+        _LAST_TAG_EDIT = time.monotonic()
+        if not _TAG_REFRESH_PENDING:
+            _TAG_REFRESH_PENDING = True
+            bpy.app.timers.register(_refresh_history_after_typing, first_interval=_TAG_FILTER_DEBOUNCE)
     
     # Tag search filter
     tag_search_filter: StringProperty(
@@ -162,331 +210,270 @@ class DFCommitProperties(bpy.types.PropertyGroup):
         update=update_tag_filter,
     )
     
-    def get_export_options(self) -> dict:
-        """Get export options as dictionary."""
+    def get_export_options(self) -> Mapping[str, bool]:
+        """Get export options as a read-only mapping (shared between calls)."""
         # If export_all is enabled, all components are exported
         if self.export_all:
-            return {
-                'vertices': True,
-                'faces': True,
-                'uv': True,
-                'normals': True,
-                'materials': True,
-            }
+            return _export_options(True, True, True, True)
         
         # Otherwise, use individual toggles
-        return {
-            'vertices': self.export_geometry,  # Geometry includes vertices
-            'faces': self.export_geometry,      # Geometry includes faces
-            'uv': self.export_uv,
-            'normals': self.export_transform,   # Transform includes normals
-            'materials': self.export_materials,
-        }
+        return _export_options(self.export_geometry, self.export_uv, self.export_transform, self.export_materials)
+
+
+@functools.lru_cache(maxsize=16)
+def _export_options(geometry: bool, uv: bool, transform: bool, materials: bool) -> Mapping[str, bool]:
+    """Build the export options mapping for one combination of toggles (16 possible)."""
+    return MappingProxyType({
+        'vertices': geometry,   # Geometry includes vertices
+        'faces': geometry,      # Geometry includes faces
+        'uv': uv,
+        'normals': transform,   # Transform includes normals
+        'materials': materials,
+    })
 
 
 def update_commit_list_index(self, context):
-    """Update callback for commit list index - loads commit to temp folder."""
-    if hasattr(context.scene, 'df_commits') and context.scene.df_commits:
-        index = context.scene.df_commit_list_index
-        if 0 <= index < len(context.scene.df_commits):
-            commit = context.scene.df_commits[index]
-            # Only load project commits to temp folder
-            if commit.commit_type == "project":
-                # Load commit to temp folder directly (without toggling selection)
-                try:
-                    from pathlib import Path
-                    from ..forester.commands import find_repository
-                    from ..forester.core.database import ForesterDB
-                    from ..forester.core.storage import ObjectStorage
-                    from ..forester.models.commit import Commit
-                    from ..forester.commands.checkout import restore_files_from_tree, restore_meshes_from_commit
-                    import shutil
-                    
-                    # Find repository
-                    blend_file = Path(bpy.data.filepath) if bpy.data.filepath else None
-                    if not blend_file:
-                        return
-                    
-                    repo_path = find_repository(blend_file.parent)
-                    if not repo_path:
-                        return
-                    
-                    dfm_dir = repo_path / ".DFM"
-                    temp_dir = dfm_dir / "preview_temp"
-                    temp_dir.mkdir(exist_ok=True)
-                    
-                    # Clean up previous preview if exists
-                    prev_temp_dir = getattr(context.scene, 'df_preview_temp_dir', '')
-                    if prev_temp_dir:
-                        prev_path = Path(prev_temp_dir)
-                        if prev_path.exists() and prev_path != dfm_dir:
-                            try:
-                                shutil.rmtree(prev_path)
-                            except Exception:
-                                pass
-                    
-                    # Create unique temp directory for this commit
-                    temp_working_dir = temp_dir / f"commit_{commit.hash[:16]}"
-                    
-                    # Clean up if exists
-                    if temp_working_dir.exists():
-                        shutil.rmtree(temp_working_dir)
-                    temp_working_dir.mkdir(parents=True)
-                    
-                    # Clean up all other old preview_temp directories (keep current one)
-                    from ..operators.operator_helpers import cleanup_old_preview_temp
-                    cleanup_old_preview_temp(repo_path, keep_current=str(temp_working_dir))
-                    
-                    db_path = dfm_dir / "forester.db"
-                    with ForesterDB(db_path) as db:
-                        storage = ObjectStorage(dfm_dir)
-                        commit_obj = Commit.from_storage(commit.hash, db, storage)
-                        
-                        if not commit_obj:
-                            return
-                        
-                        # Get tree from commit
-                        tree = commit_obj.get_tree(db, storage)
-                        if not tree:
-                            return
-                        
-                        # Restore files from tree
-                        restore_files_from_tree(tree, temp_working_dir, storage, db)
-                        
-                        # Restore meshes from commit
-                        restore_meshes_from_commit(commit_obj, temp_working_dir, storage, dfm_dir)
-                        
-                        # Store temp directory path in scene
-                        context.scene.df_preview_temp_dir = str(temp_working_dir)
-                        context.scene.df_preview_commit_hash = commit.hash
-                except Exception:
-                    pass  # Silently fail if can't load
+    """Update callback for commit list index - schedules loading the commit to temp folder."""
+    global _PENDING_PREVIEW, _LAST_PREVIEW_SELECT, _PREVIEW_LOAD_PENDING
+    # Unsaved file: no repository, nothing to preview
+    if not bpy.data.filepath:
+        return
+    
+    scene = context.scene
+    commits = getattr(scene, 'df_commits', None)
+    if not commits:
+        return
+    
+    index = scene.df_commit_list_index
+    if not 0 <= index < len(commits):
+        return
+    
+    commit = commits[index]
+    # Only load project commits to temp folder
+    if commit.commit_type != "project":
+        return
+    
+    # Same commit re-selected (Blender re-fires the update from other operators)
+    # (a timer still pending for another row sees the index moved and does nothing)
+    if commit.hash == scene.df_preview_commit_hash:
+        return
+    
+    # Defer the checkout so scrolling through the list only loads the commit the user stops on
+    _PENDING_PREVIEW = (index, commit.hash)
+    _LAST_PREVIEW_SELECT = time.monotonic()
+    if not _PREVIEW_LOAD_PENDING:
+        _PREVIEW_LOAD_PENDING = True
+        bpy.app.timers.register(_load_preview_if_stable, first_interval=_PREVIEW_DEBOUNCE)
 
 
-def register():
-    """Register custom properties."""
-    # Import and register item classes first
-    from .commit_item import DFCommitItem, DFBranchItem
-    
-    # Try to unregister first (for reload scenarios)
-    try:
-        bpy.utils.unregister_class(DFCommitProperties)
-    except (RuntimeError, ValueError):
-        pass  # Class not registered yet
-    
-    try:
-        bpy.utils.unregister_class(DFCommitItem)
-    except (RuntimeError, ValueError):
-        pass
+def _load_preview_if_stable():
+    """Timer callback: load the pending preview once the selection has been stable for _PREVIEW_DEBOUNCE seconds."""
+    global _PREVIEW_LOAD_PENDING
+    elapsed = time.monotonic() - _LAST_PREVIEW_SELECT
+    if elapsed < _PREVIEW_DEBOUNCE:
+        return _PREVIEW_DEBOUNCE - elapsed  # Selection still changing, re-arm
+    
+    _PREVIEW_LOAD_PENDING = False
+    if _PENDING_PREVIEW is None:
+        return None
+    
+    index, commit_hash = _PENDING_PREVIEW
+    scene = bpy.context.scene
+    commits = getattr(scene, 'df_commits', None)
+    # Selection moved to something that does not need a preview in the meantime
+    if not commits or scene.df_commit_list_index != index or index >= len(commits):
+        return None
+    if commits[index].hash != commit_hash:
+        return None
+    
+    _load_commit_preview(scene, commit_hash)
+    return None
+
+
+def _get_repo_ctx():
+    """Return (repo_path, dfm_dir, storage) for the current blend file, or None."""
+    cached = get_cached_repository(bpy.data.filepath)
+    if not cached:
+        return None
+    repo_path, storage = cached
+    return repo_path, storage.base_dir, storage
+
+
+def _load_commit_preview(scene, commit_hash: str) -> None:
+    """Load a project commit to the preview temp folder (without toggling selection)."""
+    global _LOADED_PREVIEW_HASH
+    # Blender re-fires the update with the same value; skip the rmtree + restore if it is already loaded
+    if (commit_hash == _LOADED_PREVIEW_HASH
+            and getattr(scene, 'df_preview_commit_hash', '') == commit_hash
+            and scene.df_preview_temp_dir and os.path.isdir(scene.df_preview_temp_dir)):
+        return
     
     try:
-        bpy.utils.unregister_class(DFBranchItem)
-    except (RuntimeError, ValueError):
-        pass
-    
-    # Register item classes
-    bpy.utils.register_class(DFCommitItem)
-    bpy.utils.register_class(DFBranchItem)
-    
-    # Register main properties class
-    bpy.utils.register_class(DFCommitProperties)
-    bpy.types.Scene.df_commit_props = bpy.props.PointerProperty(type=DFCommitProperties)
+        # Find repository (lookup and storage are reused between previews)
+        repo_ctx = _get_repo_ctx()
+        if not repo_ctx:
+            return
+        repo_path, dfm_dir, storage = repo_ctx
+        
+        temp_dir = dfm_dir / "preview_temp"
+        temp_dir.mkdir(exist_ok=True)
+        
+        # Clean up previous preview if exists (deleted in the background)
+        prev_temp_dir = getattr(scene, 'df_preview_temp_dir', '')
+        if prev_temp_dir:
+            prev_path = Path(prev_temp_dir)
+            if prev_path.exists() and prev_path != dfm_dir:
+                try:
+                    remove_tree_async(prev_path)
+                except Exception:
+                    pass
+        
+        # Create unique temp directory for this commit
+        temp_working_dir = temp_dir / f"commit_{commit_hash[:16]}"
+        
+        # Clean up if exists
+        if temp_working_dir.exists():
+            remove_tree_async(temp_working_dir)
+        temp_working_dir.mkdir(parents=True)
+        
+        # Clean up all other old preview_temp directories (keep current one) on the first
+        # preview of the session; later leftovers are handled by _sweep_preview_temp
+        if dfm_dir not in _CLEANUP_DONE:
+            cleanup_old_preview_temp(repo_path, keep_current=str(temp_working_dir))
+            _CLEANUP_DONE.add(dfm_dir)
+            # Later leftovers are swept periodically, but only once previews are in use
+            if not bpy.app.timers.is_registered(_sweep_preview_temp):
+                bpy.app.timers.register(_sweep_preview_temp, first_interval=_PREVIEW_SWEEP_INTERVAL, persistent=True)
+        
+        with ForesterDB(dfm_dir / "forester.db") as db:
+            # Commit and tree are immutable per hash: reuse them when the user goes back to a commit
+            cached = _TREE_CACHE.get(commit_hash)
+            if cached is None:
+                commit_obj = Commit.from_storage(commit_hash, db, storage)
+                
+                if not commit_obj:
+                    return
+                
+                # Get tree from commit
+                tree = commit_obj.get_tree(db, storage)
+                if not tree:
+                    return
+                
+                _TREE_CACHE[commit_hash] = (commit_obj, tree)
+                if len(_TREE_CACHE) > _TREE_CACHE_SIZE:
+                    _TREE_CACHE.popitem(last=False)
+            else:
+                commit_obj, tree = cached
+                _TREE_CACHE.move_to_end(commit_hash)
+            
+            # Restore files from tree
+            restore_files_from_tree(tree, temp_working_dir, storage, db)
+            
+            # Restore meshes from commit
+            restore_meshes_from_commit(commit_obj, temp_working_dir, storage, dfm_dir)
+        
+        # Store temp directory path in scene
+        scene.df_preview_temp_dir = str(temp_working_dir)
+        scene.df_preview_commit_hash = commit_hash
+        _LOADED_PREVIEW_HASH = commit_hash
+    except Exception:
+        pass  # Silently fail if can't load
+
+
+# Scene properties added by register(), removed by unregister(): (name, property type, keyword arguments)
+_SCENE_PROPS = (
+    ('df_commit_props', bpy.props.PointerProperty, {'type': DFCommitProperties}),
     
-    # Register collections for commits and branches (after item classes are registered)
-    bpy.types.Scene.df_commits = bpy.props.CollectionProperty(type=DFCommitItem)
-    bpy.types.Scene.df_branches = bpy.props.CollectionProperty(type=DFBranchItem)
+    # Collections for commits and branches (item classes are registered first)
+    ('df_commits', bpy.props.CollectionProperty, {'type': DFCommitItem}),
+    ('df_branches', bpy.props.CollectionProperty, {'type': DFBranchItem}),
     
     # Index properties for UIList
-    bpy.types.Scene.df_branch_list_index = bpy.props.IntProperty(name="Branch List Index", default=0)
-    bpy.types.Scene.df_commit_list_index = bpy.props.IntProperty(
-        name="Commit List Index", 
-        default=0,
-        update=update_commit_list_index
-    )
+    ('df_branch_list_index', bpy.props.IntProperty, {'name': "Branch List Index", 'default': 0}),
+    ('df_commit_list_index', bpy.props.IntProperty, {
+        'name': "Commit List Index",
+        'default': 0,
+        'update': update_commit_list_index,
+    }),
     
     # Comparison state (for mesh comparison)
-    bpy.types.Scene.df_comparison_active = bpy.props.BoolProperty(
-        name="Comparison Active",
-        default=False,
-    )
-    
-    bpy.types.Scene.df_comparison_object_name = bpy.props.StringProperty(
-        name="Comparison Object Name",
-        default="",
-    )
-    
-    bpy.types.Scene.df_original_object_name = bpy.props.StringProperty(
-        name="Original Object Name",
-        default="",
-    )
-    
-    bpy.types.Scene.df_comparison_commit_hash = bpy.props.StringProperty(
-        name="Comparison Commit Hash",
-        default="",
-    )
-    
-    bpy.types.Scene.df_comparison_axis = bpy.props.EnumProperty(
-        name="Comparison Axis",
-        description="Axis for comparison object offset",
-        items=[
-            ('X', 'X', 'Offset along X axis'),
-            ('Y', 'Y', 'Offset along Y axis'),
-            ('Z', 'Z', 'Offset along Z axis'),
-        ],
-        default='X',
-    )
+    ('df_comparison_active', bpy.props.BoolProperty, {'name': "Comparison Active", 'default': False}),
+    ('df_comparison_object_name', bpy.props.StringProperty, {'name': "Comparison Object Name", 'default': ""}),
+    ('df_original_object_name', bpy.props.StringProperty, {'name': "Original Object Name", 'default': ""}),
+    ('df_comparison_commit_hash', bpy.props.StringProperty, {'name': "Comparison Commit Hash", 'default': ""}),
+    ('df_comparison_axis', bpy.props.EnumProperty, {
+        'name': "Comparison Axis",
+        'description': "Axis for comparison object offset",
+        'items': COMPARISON_AXIS_ITEMS,
+        'default': 'X',
+    }),
     
     # Project comparison state
-    bpy.types.Scene.df_project_comparison_active = bpy.props.BoolProperty(
-        name="Project Comparison Active",
-        default=False,
-    )
-    
-    bpy.types.Scene.df_project_comparison_commit_hash = bpy.props.StringProperty(
-        name="Project Comparison Commit Hash",
-        default="",
-    )
-    
-    bpy.types.Scene.df_project_comparison_temp_dir = bpy.props.StringProperty(
-        name="Project Comparison Temp Directory",
-        default="",
-    )
+    ('df_project_comparison_active', bpy.props.BoolProperty, {'name': "Project Comparison Active", 'default': False}),
+    ('df_project_comparison_commit_hash', bpy.props.StringProperty, {'name': "Project Comparison Commit Hash", 'default': ""}),
+    ('df_project_comparison_temp_dir', bpy.props.StringProperty, {'name': "Project Comparison Temp Directory", 'default': ""}),
     
     # Preview commit state (for loading commit to temp folder on selection)
-    bpy.types.Scene.df_preview_temp_dir = bpy.props.StringProperty(
-        name="Preview Temp Directory",
-        default="",
-    )
-    
-    bpy.types.Scene.df_preview_commit_hash = bpy.props.StringProperty(
-        name="Preview Commit Hash",
-        default="",
-    )
+    ('df_preview_temp_dir', bpy.props.StringProperty, {'name': "Preview Temp Directory", 'default': ""}),
+    ('df_preview_commit_hash', bpy.props.StringProperty, {'name': "Preview Commit Hash", 'default': ""}),
     
     # Diff visualization properties
-    bpy.types.Scene.df_diff_color_scheme = bpy.props.EnumProperty(
-        name="Diff Color Scheme",
-        description="Color scheme for diff visualization",
-        items=[
-            ('displacement', 'Displacement', 'Color by vertex displacement magnitude'),
-            ('added', 'Added', 'Green for added vertices'),
-            ('removed', 'Removed', 'Red for removed vertices'),
-            ('modified', 'Modified', 'Yellow for modified vertices'),
-        ],
-        default='displacement',
-    )
+    ('df_diff_color_scheme', bpy.props.EnumProperty, {
+        'name': "Diff Color Scheme",
+        'description': "Color scheme for diff visualization",
+        'items': _DIFF_COLOR_ITEMS,
+        'default': 'displacement',
+    }),
+)
+
+_SCENE_ATTRS = tuple(name for name, _prop_type, _kwargs in _SCENE_PROPS)
+
+
+def _sweep_preview_temp():
+    """Timer callback: periodically remove stale preview_temp directories, keeping the current preview."""
+    try:
+        # Repository lookup only: no database or object storage is needed to remove folders
+        repo_path, _error = get_repository_path()
+        if repo_path:
+            current_preview = getattr(bpy.context.scene, 'df_preview_temp_dir', '') or None
+            cleanup_old_preview_temp(repo_path, keep_current=current_preview)
+    except Exception:
+        pass  # Silently fail if cleanup can't be performed
+    return _PREVIEW_SWEEP_INTERVAL
+
+
+_CLASSES = (DFMeshNameItem, DFCommitItem, DFBranchItem, DFCommitProperties)
+
+
+def register():
+    """Register custom properties."""
+    # Item classes first, then the main properties class that the scene pointer uses
+    for cls in _CLASSES:
+        # Unregister a stale copy left by a reload; look it up instead of catching errors
+        registered = getattr(bpy.types, cls.__name__, None)
+        if registered is not None:
+            bpy.utils.unregister_class(registered)
+        bpy.utils.register_class(cls)
+    
+    # Scene properties (after the classes they point to are registered)
+    for name, prop_type, kwargs in _SCENE_PROPS:
+        setattr(bpy.types.Scene, name, prop_type(**kwargs))
 
 
 def unregister():
     """Unregister custom properties."""
-    from .commit_item import DFCommitItem, DFBranchItem
+    if bpy.app.timers.is_registered(_sweep_preview_temp):
+        bpy.app.timers.unregister(_sweep_preview_temp)
+    _CLEANUP_DONE.clear()
     
-    # Unregister collections and index properties first
-    if hasattr(bpy.types.Scene, 'df_commits'):
+    # Unregister scene properties first
+    for attr in _SCENE_ATTRS:
         try:
-            del bpy.types.Scene.df_commits
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_branches'):
-        try:
-            del bpy.types.Scene.df_branches
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_branch_list_index'):
-        try:
-            del bpy.types.Scene.df_branch_list_index
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_commit_list_index'):
-        try:
-            del bpy.types.Scene.df_commit_list_index
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_commit_props'):
-        try:
-            del bpy.types.Scene.df_commit_props
-        except:
-            pass
-    
-    # Unregister comparison properties
-    if hasattr(bpy.types.Scene, 'df_comparison_active'):
-        try:
-            del bpy.types.Scene.df_comparison_active
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_comparison_object_name'):
-        try:
-            del bpy.types.Scene.df_comparison_object_name
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_original_object_name'):
-        try:
-            del bpy.types.Scene.df_original_object_name
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_comparison_commit_hash'):
-        try:
-            del bpy.types.Scene.df_comparison_commit_hash
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_comparison_axis'):
-        try:
-            del bpy.types.Scene.df_comparison_axis
-        except:
-            pass
-    
-    # Unregister project comparison properties
-    if hasattr(bpy.types.Scene, 'df_project_comparison_active'):
-        try:
-            del bpy.types.Scene.df_project_comparison_active
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_project_comparison_commit_hash'):
-        try:
-            del bpy.types.Scene.df_project_comparison_commit_hash
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_project_comparison_temp_dir'):
-        try:
-            del bpy.types.Scene.df_project_comparison_temp_dir
-        except:
-            pass
-    
-    # Unregister preview properties
-    if hasattr(bpy.types.Scene, 'df_preview_temp_dir'):
-        try:
-            del bpy.types.Scene.df_preview_temp_dir
-        except:
-            pass
-    
-    if hasattr(bpy.types.Scene, 'df_preview_commit_hash'):
-        try:
-            del bpy.types.Scene.df_preview_commit_hash
-        except:
+            delattr(bpy.types.Scene, attr)
+        except AttributeError:
             pass
     
     # Unregister classes
-    try:
-        bpy.utils.unregister_class(DFCommitProperties)
-    except (RuntimeError, ValueError):
-        pass
-    
-    try:
-        bpy.utils.unregister_class(DFBranchItem)
-    except (RuntimeError, ValueError):
-        pass
-    
-    try:
-        bpy.utils.unregister_class(DFCommitItem)
-    except (RuntimeError, ValueError):
-        pass
+    for cls in reversed(_CLASSES):
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
@@ -29,6 +29,12 @@ class DFApprovalItem(bpy.types.PropertyGroup):
     created_at: IntProperty(name="Created At")
 
 
+_CLASSES = (DFCommentItem, DFApprovalItem)
+
+# Scene properties added by register_review_properties()
+_SCENE_ATTRS = ('df_comments', 'df_approvals', 'df_review_asset_hash', 'df_review_asset_type')
+
+
 def register_review_properties():
     """Register review properties."""
     if not hasattr(bpy.types.Scene, 'df_comments'):
@@ -40,19 +46,24 @@ def register_review_properties():
 
 def register():
     """Register review property classes."""
-    bpy.utils.register_class(DFCommentItem)
-    bpy.utils.register_class(DFApprovalItem)
+    for cls in _CLASSES:
+        # A stale class from a previous load (e.g. script reload) must go first
+        registered = getattr(bpy.types, cls.__name__, None)
+        if registered is not None:
+            bpy.utils.unregister_class(registered)
+        bpy.utils.register_class(cls)
     register_review_properties()
 
 
 def unregister():
     """Unregister review property classes."""
-    if hasattr(bpy.types.Scene, 'df_comments'):
-        del bpy.types.Scene.df_comments
-        del bpy.types.Scene.df_approvals
-        del bpy.types.Scene.df_review_asset_hash
-        del bpy.types.Scene.df_review_asset_type
+    for attr in _SCENE_ATTRS:
+        try:
+            delattr(bpy.types.Scene, attr)
+        except AttributeError:
+            pass
     
-    bpy.utils.unregister_class(DFCommentItem)
-    bpy.utils.unregister_class(DFApprovalItem)
+    for cls in reversed(_CLASSES):
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
 
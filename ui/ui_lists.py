@@ -5,6 +5,21 @@ UI Lists for Difference Machine add-on.
 import bpy
 from bpy.types import UIList
 
+from ..properties.commit_item import format_commit_date
+
+
+def _builtin_icon_value(name: str) -> int:
+    """Integer id of a built-in icon, for layout.label(icon_value=...)."""
+    return bpy.types.UILayout.bl_rna.functions['label'].parameters['icon'].enum_items[name].value
+
+
+# Icon ids resolved once at import instead of an enum name lookup per label per row
+_ICON_PLAY = _builtin_icon_value('PLAY')
+_ICON_BLANK = _builtin_icon_value('BLANK1')
+_ICON_MESH = _builtin_icon_value('MESH_DATA')
+_ICON_FOLDER = _builtin_icon_value('FILE_FOLDER')
+_ICON_FILE = _builtin_icon_value('FILE')
+
 
 class DF_UL_branch_list(UIList):
     """UIList for displaying branches."""
@@ -12,37 +27,20 @@ class DF_UL_branch_list(UIList):
     
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         """Draw a single branch item."""
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+        layout_type = self.layout_type
+        label = layout.label
+        if layout_type == 'DEFAULT' or layout_type == 'COMPACT':
             # Current branch indicator (play icon for current branch)
-            if item.is_current:
-                layout.label(text="", icon='PLAY')
-                # Branch name (highlighted for current)
-                layout.label(text=item.name)
-            else:
-                layout.label(text="", icon='BLANK1')
-                layout.label(text=item.name)
-            
-            # Commit count
-            if item.commit_count > 0:
-                # Use proper pluralization
-                commit_text = "commit" if item.commit_count == 1 else "commits"
-                layout.label(text=f"{item.commit_count} {commit_text}")
-            else:
-                layout.label(text="0 commits")
+            label(text="", icon_value=_ICON_PLAY if item.is_current else _ICON_BLANK)
             
-            # Info icon
-            layout.label(text="", icon='INFO')
-            
-            # Last commit message (truncated)
-            if item.last_commit_message:
-                msg = item.last_commit_message[:20] + "..." if len(item.last_commit_message) > 20 else item.last_commit_message
-                layout.label(text=f"Last: {msg}")
-            else:
-                layout.label(text="Last: —")
+            # "Name | N commits | Last: message", formatted on refresh
+            # (items saved before the texts were cached are formatted here; draw can't write to them)
+            row_text = item.row_text or item.format_row_text(item.format_commit_count(), item.format_last_commit())
+            label(text=row_text)
         
-        elif self.layout_type in {'GRID'}:
+        elif layout_type == 'GRID':
             layout.alignment = 'CENTER'
-            layout.label(text="", icon_value=icon)
+            label(text="", icon_value=icon)
 
 
 class DF_UL_commit_list(UIList):
@@ -51,36 +49,19 @@ class DF_UL_commit_list(UIList):
     
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         """Draw a single commit item."""
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            # Format: message + author + date time
-            import datetime
-            
-            # Get date time
-            try:
-                date_str = datetime.datetime.fromtimestamp(item.timestamp).strftime('%Y-%m-%d %H:%M')
-            except:
-                date_str = "Unknown"
-            
-            # Format message (truncate if too long to fit in UI)
-            message_text = item.message[:30] + "..." if len(item.message) > 30 else item.message
-            
-            # Add tag to display if present
-            tag_text = f" [{item.tag}]" if item.tag else ""
-            
-            # Build full text: message + tag + author + date time
-            # Format: "Message [Tag] | Author | Date Time"
-            full_text = f"{message_text}{tag_text} | {item.author} | {date_str}"
+        layout_type = self.layout_type
+        label = layout.label
+        if layout_type == 'DEFAULT' or layout_type == 'COMPACT':
+            # "Message [Tag] | Author | Date Time", formatted on refresh
+            # (items saved before the texts were cached are formatted here; draw can't write to them)
+            display_text = item.display_text or item.format_display_text(format_commit_date(item.timestamp))
             
             # Commit type indicator
-            if item.commit_type == "mesh_only":
-                layout.label(text="", icon='MESH_DATA')
-            else:
-                layout.label(text="", icon='FILE_FOLDER')
+            label(text="", icon_value=_ICON_MESH if item.commit_type == "mesh_only" else _ICON_FOLDER)
             
             # Display full text
-            layout.label(text=full_text, icon='FILE')
+            label(text=display_text, icon_value=_ICON_FILE)
         
-        elif self.layout_type in {'GRID'}:
+        elif layout_type == 'GRID':
             layout.alignment = 'CENTER'
-            layout.label(text="", icon_value=icon)
-
+            label(text="", icon_value=icon)
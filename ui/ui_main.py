@@ -4,6 +4,7 @@ Contains panels and menus registration.
 """
 import bpy
 import logging
+from . import ui_panels
 from .ui_panels import (
     DF_PT_commit_panel,
     DF_PT_history_panel,
@@ -25,6 +26,7 @@ from ..operators.commit_operators import (
     DF_OT_init_project,
     DF_OT_rebuild_database,
     DF_OT_garbage_collect,
+    DF_OT_auto_garbage_collect,
     DF_OT_clear_tag_filter,
 )
 from ..operators.history_operators import (
@@ -74,6 +76,7 @@ classes = [
     DF_OT_init_project,
     DF_OT_rebuild_database,
     DF_OT_garbage_collect,
+    DF_OT_auto_garbage_collect,
     DF_OT_clear_tag_filter,
     # History operators
     DF_OT_select_commit,
@@ -95,13 +98,17 @@ classes = [
     DF_OT_toggle_export_component,
 ]
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
     """Register UI classes and properties"""
     try:
         # Register UI classes
-        for cls in classes:
-            bpy.utils.register_class(cls)
+        _register_classes()
+        
+        # Invalidate the commit panel's selection cache on scene changes
+        ui_panels.register_handlers()
         
         # Register material update hook for Blender node_tree
         register_material_update_hook(update_blender_node_tree)
@@ -120,9 +127,10 @@ def unregister():
         except Exception as e:
             logger.warning(f"Error unregistering material update hook: {e}", exc_info=True)
         
-        # Unregister UI classes
-        for cls in reversed(classes):
-            bpy.utils.unregister_class(cls)
+        ui_panels.unregister_handlers()
+        
+        # Unregister UI classes (in reverse order)
+        _unregister_classes()
     except Exception as e:
         logger.error(f"Error unregistering UI classes: {e}", exc_info=True)
         raise
@@ -3,8 +3,105 @@ UI panels for Difference Machine add-on.
 """
 
 import bpy
+import time
 from bpy.types import Panel
 from pathlib import Path
+from typing import Optional, Tuple
+
+from ..properties.commit_item import parse_mesh_names
+
+# (name, vertex count, face count) of the selected meshes shown by the commit panel.
+# Plain values, not Object references, so nothing dangles after delete/undo;
+# reset to None by _invalidate_selected_meshes whenever the scene changes.
+_SELECTED_MESHES: Optional[Tuple[Tuple[str, int, int], ...]] = None
+
+# time.monotonic() of the last list autoload; panels that find an empty list wait
+# _AUTOLOAD_RETRY seconds before asking again, so an empty repository is not reloaded per redraw
+_LAST_AUTOLOAD = 0.0
+_AUTOLOAD_RETRY = 5.0
+
+
+@bpy.app.handlers.persistent
+def _invalidate_selected_meshes(*args) -> None:
+    """depsgraph_update_post/undo/redo/load handler: selection or mesh data may have changed."""
+    global _SELECTED_MESHES
+    _SELECTED_MESHES = None
+
+
+def _selected_meshes(context) -> Tuple[Tuple[str, int, int], ...]:
+    """Return (name, vertex count, face count) for selected mesh objects, rebuilt only after a scene change."""
+    global _SELECTED_MESHES
+    if _SELECTED_MESHES is None:
+        _SELECTED_MESHES = tuple(
+            (obj.name, len(obj.data.vertices), len(obj.data.polygons)) if obj.data else (obj.name, -1, -1)
+            for obj in context.selected_objects if obj.type == 'MESH'
+        )
+    return _SELECTED_MESHES
+
+
+def _autoload_lists():
+    """Timer callback: fill the branch and history lists for the opened blend file."""
+    global _LAST_AUTOLOAD
+    _LAST_AUTOLOAD = time.monotonic()
+    try:
+        from ..operators.operator_helpers import is_repository_initialized
+        if bpy.data.filepath and is_repository_initialized(bpy.context):
+            bpy.ops.df.refresh_branches()
+            bpy.ops.df.refresh_history()
+    except Exception:
+        pass  # Lists stay empty; the panels' Refresh buttons still work
+    return None
+
+
+@bpy.app.handlers.persistent
+def _schedule_autoload(*args) -> None:
+    """load_post/save_post handler: load the lists once the file is open or saved (never from draw())."""
+    if not bpy.app.timers.is_registered(_autoload_lists):
+        bpy.app.timers.register(_autoload_lists, first_interval=0.1)
+
+
+def _request_autoload() -> None:
+    """Called from draw() when a list is empty: schedule a one-shot reload, at most every _AUTOLOAD_RETRY seconds."""
+    if time.monotonic() - _LAST_AUTOLOAD >= _AUTOLOAD_RETRY:
+        _schedule_autoload()
+
+
+def _autoload_handler_lists():
+    """Handler lists after which the branch and history lists are reloaded."""
+    return (bpy.app.handlers.load_post, bpy.app.handlers.save_post)
+
+
+def _handler_lists():
+    """Handler lists that invalidate the selected mesh cache."""
+    handlers = bpy.app.handlers
+    return (handlers.depsgraph_update_post, handlers.undo_post, handlers.redo_post, handlers.load_post)
+
+
+def register_handlers() -> None:
+    """Register the handlers that keep the commit panel's selection cache and the lists fresh."""
+    for handlers in _handler_lists():
+        if _invalidate_selected_meshes not in handlers:
+            handlers.append(_invalidate_selected_meshes)
+    for handlers in _autoload_handler_lists():
+        if _schedule_autoload not in handlers:
+            handlers.append(_schedule_autoload)
+    # Add-on enabled with a file already open
+    _schedule_autoload()
+
+
+def unregister_handlers() -> None:
+    """Remove handlers added by register_handlers()."""
+    global _SELECTED_MESHES
+    for handlers in _handler_lists():
+        if _invalidate_selected_meshes in handlers:
+            handlers.remove(_invalidate_selected_meshes)
+    for handlers in _autoload_handler_lists():
+        if _schedule_autoload in handlers:
+            handlers.remove(_schedule_autoload)
+    if bpy.app.timers.is_registered(_autoload_lists):
+        bpy.app.timers.unregister(_autoload_lists)
+    _SELECTED_MESHES = None
+
 
 def get_current_branch_name(context):
     """Get current branch name from repository or return default."""
@@ -69,8 +166,8 @@ class DF_PT_commit_panel(Panel):
         row = layout.row()
         row.prop(props, "commit_mode", expand=True)
         
-        # Get selected mesh objects (needed for both modes)
-        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        # Get selected mesh objects (needed for both modes; cached between scene changes)
+        selected_objects = _selected_meshes(context)
         
         # Selected Object mode
         if props.commit_mode == 'SELECTED_OBJECT':
@@ -79,15 +176,15 @@ class DF_PT_commit_panel(Panel):
                 box.label(text="Select mesh objects to commit", icon='INFO')
             else:
                 # Show selected objects info
-                for obj in selected_objects:
+                for name, vertex_count, face_count in selected_objects:
                     box = layout.box()
                     row = box.row()
-                    row.label(text=f"Object: {obj.name}", icon='MESH_DATA')
+                    row.label(text=f"Object: {name}", icon='MESH_DATA')
                     
-                    if obj.data:
+                    if vertex_count >= 0:
                         row = box.row()
-                        row.label(text=f"Vertices: {len(obj.data.vertices)}")
-                        row.label(text=f"Faces: {len(obj.data.polygons)}")
+                        row.label(text=f"Vertices: {vertex_count}")
+                        row.label(text=f"Faces: {face_count}")
                 
                 # Export Options
                 box = layout.box()
@@ -211,14 +308,11 @@ class DF_PT_branch_panel(Panel):
             box = layout.box()
             box.label(text="Please save the Blender file first", icon='ERROR')
         
-        # Auto-refresh if list is empty and file is saved and repo initialized
+        # Lists are loaded by a timer after file load/save (see _schedule_autoload), never from draw();
+        # an empty list only asks for another one-shot load
         branches = scene.df_branches
-        if len(branches) == 0 and bpy.data.filepath and repo_initialized:
-            # Try to auto-load
-            try:
-                bpy.ops.df.refresh_branches()
-            except:
-                pass
+        if len(branches) == 0 and file_saved and repo_initialized:
+            _request_autoload()
         
         # List branches using UIList (only if repo initialized)
         if repo_initialized:
@@ -333,14 +427,11 @@ class DF_PT_history_panel(Panel):
         current_branch = get_current_branch_name(context)
         row.label(text=current_branch)
         
-        # Auto-refresh if list is empty and file is saved
+        # Lists are loaded by a timer after file load/save (see _schedule_autoload), never from draw();
+        # an empty list only asks for another one-shot load (not when a tag filter emptied it)
         commits = context.scene.df_commits
-        if len(commits) == 0 and bpy.data.filepath:
-            # Try to auto-load
-            try:
-                bpy.ops.df.refresh_history()
-            except:
-                pass
+        if len(commits) == 0 and bpy.data.filepath and not props.tag_search_filter:
+            _request_autoload()
         
         # List commits using UIList
         if len(commits) == 0:
@@ -378,19 +469,11 @@ class DF_PT_history_panel(Panel):
                 
                 # Action buttons - для mesh_only коммитов показываем Replace и Compare
                 if commit.commit_type == "mesh_only":
-                    # Display mesh information for all meshes in the commit
-                    mesh_names_str = commit.selected_mesh_names or ""
-                    
-                    # Парсим selected_mesh_names (может быть JSON строка или обычная строка)
-                    try:
-                        import json
-                        if mesh_names_str.startswith('['):
-                            mesh_names = json.loads(mesh_names_str)
-                        else:
-                            # Если это строка с запятыми
-                            mesh_names = [name.strip() for name in mesh_names_str.split(',') if name.strip()]
-                    except:
-                        mesh_names = [mesh_names_str] if mesh_names_str else []
+                    # Display mesh information for all meshes in the commit (names parsed on refresh;
+                    # items saved before that are parsed here, since draw can't write to them)
+                    mesh_names = [item.name for item in commit.mesh_names]
+                    if not mesh_names and commit.selected_mesh_names:
+                        mesh_names = parse_mesh_names(commit.selected_mesh_names)
                     
                     # Load and display mesh information
                     if mesh_names: